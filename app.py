@@ -5,7 +5,6 @@ import csv
 import openpyxl # type: ignore
 import os
 from dotenv import load_dotenv
-from pathlib import Path
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
@@ -17,6 +16,22 @@ import base64
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
+from string import Template
+import threading
+import queue
+import hashlib
+import tempfile
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from src.stats.posting_history import PostingHistory
+from src.archive.run_archive import RunArchive
+from src.sheets.sheet_loader import SheetSnapshotLoader
+from src.clubs.club import Club
+from src.usga.usga_processor import USGAProcessor
+from src.mtech.mtech_client import MTechClient
+from src.mtech.tee_sheet_tracker import TeeSheetTracker
+from src.identity.identity_map import IdentityMap
 
 # Load environment variables
 load_dotenv()
@@ -30,57 +45,114 @@ except ValueError:
     # If that fails, try 2-digit year format
     date = datetime.datetime.strptime(date_str, '%m-%d-%y').date()
 
-# Get API key from environment variable
-api_key = os.getenv('MTECH_API_KEY')
-mtechAPIUrl = f'https://www.clubmtech.com/cmtapi/teetimes/?apikey={api_key}&TheDate={date.month}-{date.day}-{date.year}'
-
 # Update SCOPES to include Google Sheets
 SCOPES = [
     'https://www.googleapis.com/auth/gmail.readonly',
     'https://www.googleapis.com/auth/gmail.send',
-    'https://www.googleapis.com/auth/spreadsheets'
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive.metadata.readonly'
 ]
 
-# Add at the top with other global variables
-cached_sheets = {}
+# Club configured from environment variables, used unless --clubs is given
+default_club = Club.from_env()
+
+# The club being processed by the current thread
+_club_local = threading.local()
+
+# HTTP connections are pooled across all clubs
+http_session = requests.Session()
+
+# Google credentials per token file
+_creds_cache = {}
+_creds_lock = threading.Lock()
 
-def get_google_creds():
+# Built Google API services shared by every thread and club: idle services
+# per (token, api, version), and the ones each thread currently holds
+_service_lock = threading.Lock()
+_idle_services = {}
+_thread_services = threading.local()
+
+def current_club():
+    """Return the club the current thread is processing."""
+    return getattr(_club_local, 'club', default_club)
+
+def log(message):
+    """Print a progress or error line tagged with the club it belongs to."""
+    print(f"[{current_club().name}] {message}")
+
+def get_google_creds(token_path=None):
     """Get and refresh Google credentials."""
-    creds = None
-    if os.path.exists('token.json'):
-        with open('token.json', 'rb') as token:
-            creds = pickle.load(token)
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open('token.json', 'wb') as token:
-            pickle.dump(creds, token)
+    token_path = token_path or current_club().token_path
+    with _creds_lock:
+        creds = _creds_cache.get(token_path)
+        if not creds and os.path.exists(token_path):
+            with open(token_path, 'rb') as token:
+                creds = pickle.load(token)
+        
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    'credentials.json', SCOPES)
+                creds = flow.run_local_server(port=0)
+            with open(token_path, 'wb') as token:
+                pickle.dump(creds, token)
+        _creds_cache[token_path] = creds
     return creds
 
+def _checkout_service(key):
+    with _service_lock:
+        idle = _idle_services.get(key)
+        if idle:
+            return idle.pop()
+    token_path, api_name, api_version = key
+    return build(api_name, api_version, credentials=get_google_creds(token_path))
+
+def _checkin_service(key, service):
+    with _service_lock:
+        _idle_services.setdefault(key, []).append(service)
+
+def get_service(api_name, api_version, token_path=None):
+    """Return a Google API service held by the current thread.
+
+    googleapiclient services are not thread-safe, so a thread takes one
+    from the shared pool and keeps it until release_services() hands it
+    back for any later thread or club using the same token.
+    """
+    key = (token_path or current_club().token_path, api_name, api_version)
+    held = getattr(_thread_services, 'held', None)
+    if held is None:
+        held = _thread_services.held = {}
+    if key not in held:
+        held[key] = _checkout_service(key)
+    return held[key]
+
+def release_services():
+    """Return the services held by the current thread to the shared pool."""
+    held = getattr(_thread_services, 'held', {})
+    for key, service in held.items():
+        _checkin_service(key, service)
+    held.clear()
+
+@contextmanager
+def pooled_service(api_name, api_version, token_path):
+    """Borrow a service from the shared pool for the duration of a block."""
+    key = (token_path, api_name, api_version)
+    service = _checkout_service(key)
+    try:
+        yield service
+    finally:
+        _checkin_service(key, service)
+
 def update_google_sheet(sheet_id, sheet_name, golfer_list):
     """Update Google Sheet with golfer data."""
-    global cached_sheets
-    creds = get_google_creds()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service('sheets', 'v4')
     today_date = datetime.date.strftime(date, "%m-%d-%y")
     
     try:
-        # Use cached data if available
-        if sheet_name in cached_sheets:
-            existing_data = cached_sheets[sheet_name]
-        else:
-            # Get existing data
-            result = service.spreadsheets().values().get(
-                spreadsheetId=sheet_id,
-                range=f'{sheet_name}!A:C'
-            ).execute()
-            existing_data = result.get('values', [])
-            cached_sheets[sheet_name] = existing_data
+        # Use cached data for exactly this range if available
+        existing_data = get_sheet_range(sheet_id, f'{sheet_name}!A:C')
             
         if not existing_data:
             existing_data = [['Name', 'Count', 'Dates']]
@@ -125,34 +197,18 @@ def update_google_sheet(sheet_id, sheet_name, golfer_list):
         ).execute()
         
     except Exception as e:
-        print(f"Error updating Google Sheet: {e}")
+        log(f"Error updating Google Sheet: {e}")
+    finally:
+        invalidate_sheet(sheet_id, sheet_name)
 
 def test_gmail_connection():
     """Test Gmail API connection and list recent emails."""
-    creds = None
-    # The file token.json stores the user's access and refresh tokens
-    if os.path.exists('token.json'):
-        with open('token.json', 'rb') as token:
-            creds = pickle.load(token)
-    
-    # If there are no (valid) credentials available, let the user log in.
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
-        # Save the credentials for the next run
-        with open('token.json', 'wb') as token:
-            pickle.dump(creds, token)
-
     try:
         # Create Gmail API service
-        service = build('gmail', 'v1', credentials=creds)
+        service = get_service('gmail', 'v1')
         
         # Get list of messages
-        results = service.users().messages().list(userId='nhcchandicapcheck@gmail.com', maxResults=5).execute()
+        results = service.users().messages().list(userId=current_club().gmail_user, maxResults=5).execute()
         messages = results.get('messages', [])
 
         if not messages:
@@ -160,7 +216,7 @@ def test_gmail_connection():
         
         return True
     except Exception as e:
-        print(f'An error occurred: {e}')
+        log(f'An error occurred: {e}')
         return False
 
 def removeAfterCharacter(text, char):
@@ -170,22 +226,47 @@ def removeAfterCharacter(text, char):
     return text
 
 
-def getMTechData():
-    with requests.Session() as s:
-        download = s.get(mtechAPIUrl)
+def get_mtech_url():
+    """MTech tee time URL for the current club and date."""
+    api_key = current_club().mtech_api_key
+    return f'https://www.clubmtech.com/cmtapi/teetimes/?apikey={api_key}&TheDate={date.month}-{date.day}-{date.year}'
 
-        decodedContet = download.content.decode('utf-8')
+def iter_mtech_lines():
+    """Stream the MTech tee sheet response line by line."""
+    run_archive = current_club().archive
+    with http_session.get(get_mtech_url(), stream=True) as download:
+        # An error body must fail the run, not parse as an empty tee sheet
+        download.raise_for_status()
+        recorded = [] if run_archive else None
 
-        teeSheet = csv.reader(decodedContet.splitlines(), delimiter=",")
-        teeSheet = list(teeSheet)
-        teeSheet = teeSheet[1:]
-        
-        return teeSheet
+        def chunks():
+            for chunk in download.iter_content(chunk_size=8192):
+                if recorded is not None:
+                    recorded.append(chunk)
+                yield chunk
+
+        yield from MTechClient.iter_text_lines(chunks())
+        if recorded is not None:
+            run_archive.put(RunArchive.MTECH_CSV, b''.join(recorded))
+
+def getMTechData():
+    """Lazily yield MTech tee sheet rows, skipping the header row."""
+    run_archive = current_club().archive
+    if run_archive and run_archive.replaying:
+        lines = (run_archive.get(RunArchive.MTECH_CSV) or b'').decode('utf-8').splitlines()
+    else:
+        lines = iter_mtech_lines()
+
+    teeSheet = csv.reader(lines, delimiter=",")
+    next(teeSheet, None)
+    # Blank or truncated rows have no GHIN column to check
+    for row in teeSheet:
+        if len(row) >= 4:
+            yield row
 
 def get_email_attachment(search_date):
     """Get XLSX attachment from GHIN email for the specified date."""
-    creds = get_google_creds()
-    service = build('gmail', 'v1', credentials=creds)
+    service = get_service('gmail', 'v1')
     
     # Format date for email search (next day after golf date)
     email_date = search_date + datetime.timedelta(days=1)
@@ -220,8 +301,6 @@ def get_email_attachment(search_date):
                 file_data = file_data.replace('-', '+').replace('_', '/')
                 
                 # Create a temporary file to store the Excel data
-                import tempfile
-                
                 temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
                 temp_file.write(base64.urlsafe_b64decode(file_data))
                 temp_file.close()
@@ -231,103 +310,153 @@ def get_email_attachment(search_date):
         raise Exception("No XLSX attachment found in email")
         
     except Exception as e:
-        print(f"Error getting email attachment: {e}")
+        log(f"Error getting email attachment: {e}")
         raise
 
-def getUSGAData():
-    """Get USGA data once and cache it."""
-    if not hasattr(getUSGAData, 'cached_data'):
+def get_report_dates():
+    """Dates of the GHIN report emails inside the current club's grace window."""
+    grace_days = current_club().posting_grace_days
+    return [date + datetime.timedelta(days=offset) for offset in range(1, grace_days + 1)]
+
+def fetch_usga_report(report_date, processor):
+    """Make sure the GHIN report emailed on report_date is in the processor's reports directory."""
+    run_archive = current_club().archive
+    member = RunArchive.ghin_report_name(report_date)
+    if run_archive and run_archive.replaying:
+        file_data = run_archive.get(member)
+        if file_data is None and report_date == date + datetime.timedelta(days=1):
+            file_data = run_archive.get(RunArchive.GHIN_XLSX)
+        if file_data is None:
+            return False
+        processor.save_report(report_date, file_data)
+        return True
+
+    if not processor.has_report(report_date):
         try:
-            # Get the XLSX file from email
-            excel_file = get_email_attachment(date)
-            
-            # Read the Excel file
-            postData = openpyxl.load_workbook(excel_file)
-            sheet = postData.active
-            golfers = []
-            for row in sheet:
-                golfers.append([cell.value for cell in row])
-            
-            # Clean up temporary file
-            os.unlink(excel_file)
-            
-            # Cache the data
-            getUSGAData.cached_data = golfers[1:]  # Skip header row
-            
-        except Exception as e:
-            print(f"Error reading USGA data: {e}")
-            raise
-            
-    return getUSGAData.cached_data
+            # The search looks for the email sent the day after the given date
+            excel_file = get_email_attachment(report_date - datetime.timedelta(days=1))
+        except Exception:
+            return False
+        with open(excel_file, 'rb') as f:
+            processor.save_report(report_date, f.read())
+        # Clean up temporary file
+        os.unlink(excel_file)
+    if run_archive:
+        run_archive.put(member, processor.read_report(report_date))
+    return True
+
+def getUSGAData():
+    """Collect the GHIN reports in the grace window once and cache their posting index."""
+    club = current_club()
+
+    def collect(processor):
+        report_dates = get_report_dates()
+        # Reports dated after today can't have been emailed yet; replay has them archived
+        if club.archive and club.archive.replaying:
+            due_dates = report_dates
+        else:
+            due_dates = [d for d in report_dates if d <= datetime.date.today()]
+        fetched = [d for d in due_dates if fetch_usga_report(d, processor)]
+        if not fetched:
+            raise Exception(f"No GHIN report available for {date.strftime('%m-%d-%y')}")
+        if len(fetched) < len(report_dates):
+            not_due = len(report_dates) - len(due_dates)
+            log(f"Only {len(fetched)} of {len(report_dates)} GHIN reports in the posting window are available"
+                + (f" ({not_due} not due until after today)" if not_due else ""))
+        
+        # Parse new reports and build the set of GHINs posted in this window
+        processor.get_posting_index(report_dates)
+        return processor
+
+    def load():
+        if club.archive and club.archive.replaying:
+            # Unpack the archived reports into a scratch directory so replay
+            # neither touches nor depends on the club's usgaReports
+            with tempfile.TemporaryDirectory(prefix='ghin-replay-') as scratch_dir:
+                return collect(USGAProcessor(scratch_dir))
+        return collect(USGAProcessor(club.usga_dir))
+
+    try:
+        return club.cache.get_or_load(('usga', date, club.posting_grace_days), load)
+    except Exception as e:
+        log(f"Error reading USGA data: {e}")
+        raise
 
 def checkPosting(golfer):
-    """Check if a golfer has posted their score."""
+    """Check if a golfer posted their score within the club's grace window."""
     try:
-        usga_data = getUSGAData()  # This will now use cached data after first call
-        golfer_id = int(golfer)
-        
-        for usga in usga_data:
-            if int(usga[0]) == golfer_id:
-                return True
-        return False
+        processor = getUSGAData()  # This will now use cached data after first call
+        return processor.posted_within(golfer, date, current_club().posting_grace_days)
     except Exception as e:
-        print(f"Error checking posting: {e}")
+        log(f"Error checking posting: {e}")
         return False
 
 def normalize_name(name):
     """Normalize name by removing extra spaces and special characters"""
     return ' '.join(name.strip().lower().split())
 
+def get_snapshot_loader():
+    """Sheet snapshot loader for the current club."""
+    club = current_club()
+    token_path = club.token_path
+    return SheetSnapshotLoader(get_google_creds(),
+                               snapshot_path=club.cache_dir / 'sheet_snapshot.json',
+                               service=lambda api_name, api_version: pooled_service(
+                                   api_name, api_version, token_path))
+
+ROSTER_RANGE = 'Sheet1!A:E'
+EXCLUDED_DATES_RANGE = 'ExcludedDates!A:C'
+
+def get_sheet_range(sheet_id, sheet_range):
+    """Get a sheet range through the current club's cache, fetching it on a miss."""
+    def load():
+        result = get_service('sheets', 'v4').spreadsheets().values().get(
+            spreadsheetId=sheet_id,
+            range=sheet_range
+        ).execute()
+        return result.get('values', [])
+    return current_club().cache.get_or_load((sheet_id, None, sheet_range), load)
+
+def invalidate_sheet(sheet_id, sheet_name):
+    """Drop every cached range of a sheet tab after writing to it."""
+    current_club().cache.invalidate(source=sheet_id, range_prefix=f'{sheet_name}!')
+
 def cache_sheet_data():
     """Cache all sheet data at startup to avoid rate limits"""
-    creds = get_google_creds()
-    service = build('sheets', 'v4', credentials=creds)
+    club = current_club()
+    excluded_range = (club.sheet_id, EXCLUDED_DATES_RANGE)
+    roster_range = (club.roster_sheet_id, ROSTER_RANGE)
     
-    # Cache all needed data
+    # Cache all needed data, fetched concurrently or from the local snapshot
     try:
-        # Get excluded dates
-        result = service.spreadsheets().values().get(
-            spreadsheetId=os.getenv('GOOGLE_SHEET_ID'),
-            range='ExcludedDates!A:C'
-        ).execute()
-        cache_sheet_data.excluded_dates = result.get('values', [])
-        
-        # Get roster data
-        result = service.spreadsheets().values().get(
-            spreadsheetId=os.getenv('ROSTER_SHEET_ID'),
-            range='Sheet1!A:E'
-        ).execute()
-        cache_sheet_data.roster = result.get('values', [])
+        data = get_snapshot_loader().load([excluded_range, roster_range])
+        for (sheet_id, sheet_range), values in data.items():
+            club.cache.set((sheet_id, None, sheet_range), values)
+
+        if club.archive:
+            club.archive.put_json(RunArchive.ROSTER, data[roster_range])
+            club.archive.put_json(RunArchive.EXCLUDED_DATES, data[excluded_range])
         
         return True
     except Exception as e:
-        print(f"Error caching sheet data: {e}")
+        log(f"Error caching sheet data: {e}")
         return False
 
 def get_sheet(sheet_name):
     """Get a specific sheet from the Google Spreadsheet with caching."""
-    global cached_sheets
-    
-    # Return cached data if available
-    if sheet_name in cached_sheets:
-        return cached_sheets[sheet_name]
-        
     try:
-        creds = get_google_creds()
-        service = build('sheets', 'v4', credentials=creds)
-        
-        # Get the sheet data
-        result = service.spreadsheets().values().get(
-            spreadsheetId=os.getenv('GOOGLE_SHEET_ID'),
-            range=f'{sheet_name}!A:C'
-        ).execute()
-        
-        # Cache the result
-        cached_sheets[sheet_name] = result.get('values', [])
-        return cached_sheets[sheet_name]
+        return get_sheet_range(current_club().sheet_id, f'{sheet_name}!A:C')
     except Exception as e:
         return None
 
+def get_roster():
+    """Get the current club's roster rows, or None if they can't be loaded."""
+    try:
+        return get_sheet_range(current_club().roster_sheet_id, ROSTER_RANGE)
+    except Exception as e:
+        log(f"Error loading roster: {e}")
+        return None
+
 def get_excluded_times(date_str):
     excluded_times = []
     try:
@@ -352,12 +481,13 @@ def get_excluded_times(date_str):
 
 def check_roster(golfer_name):
     """Check if golfer exists in roster and has a GHIN number"""
-    if not hasattr(cache_sheet_data, 'roster'):
+    roster = get_roster()
+    if roster is None:
         return False, False
         
     normalized_golfer = normalize_name(golfer_name)
     
-    for row in cache_sheet_data.roster[1:]:  # Skip header
+    for row in roster[1:]:  # Skip header
         if not row[0]:  # Skip empty names
             continue
             
@@ -411,22 +541,40 @@ def get_current_date():
     """Get the current date in the format used in the ExcludedDates sheet"""
     return date.strftime("%m-%d-%y")  # Make sure we're using the right format
 
+def find_roster_row(roster, golfer_name):
+    """Index of the first roster row with the golfer's name, or None."""
+    normalized_golfer = normalize_name(golfer_name)
+    for row_index, row in enumerate(roster[1:], start=1):  # Skip header
+        if row and row[0] and normalize_name(row[0]) == normalized_golfer:
+            return row_index
+    return None
+
+def find_roster_row_by_ghin(roster, ghin_number):
+    """Index of the first roster row with the GHIN number, or None."""
+    ghin_number = str(ghin_number).strip()
+    for row_index, row in enumerate(roster[1:], start=1):  # Skip header
+        if len(row) > 1 and row[1] and str(row[1]).strip() == ghin_number:
+            return row_index
+    return None
+
+def roster_row_info(row):
+    """Return (has_ghin, email, gender, member_number) from a roster row."""
+    has_ghin = len(row) > 1 and row[1] and row[1].strip()
+    email = row[2].strip() if len(row) > 2 and row[2] else None
+    gender = row[3].strip().upper() if len(row) > 3 and row[3] else None
+    member_number = row[4].strip() if len(row) > 4 and row[4] else None
+    return has_ghin, email, gender, member_number
+
 def get_roster_info(golfer_name):
     """Return (exists, has_ghin, email, gender, member_number) for a golfer."""
-    if not hasattr(cache_sheet_data, 'roster'):
+    roster = get_roster()
+    if roster is None:
         return False, False, None, None, None
 
-    normalized_golfer = normalize_name(golfer_name)
-    for row in cache_sheet_data.roster[1:]:  # Skip header
-        if not row[0]:
-            continue
-        if normalize_name(row[0]) == normalized_golfer:
-            has_ghin = len(row) > 1 and row[1] and row[1].strip()
-            email = row[2].strip() if len(row) > 2 and row[2] else None
-            gender = row[3].strip().upper() if len(row) > 3 and row[3] else None
-            member_number = row[4].strip() if len(row) > 4 and row[4] else None
-            return True, has_ghin, email, gender, member_number
-    return False, False, None, None, None
+    row_index = find_roster_row(roster, golfer_name)
+    if row_index is None:
+        return False, False, None, None, None
+    return (True,) + roster_row_info(roster[row_index])
 
 def build_no_post_email(men, women, date_str):
     """Create separate Excel files for men and women non-posting golfers."""
@@ -453,8 +601,9 @@ def build_no_post_email(men, women, date_str):
             row += 1
         
         # Save to a temporary file
-        temp_file = f'reports/non_posters_{gender}_{date_str.replace("-", "_")}.xlsx'
-        Path('reports').mkdir(parents=True, exist_ok=True)
+        reports_dir = current_club().reports_dir
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = str(reports_dir / f'non_posters_{gender}_{date_str.replace("-", "_")}.xlsx')
         wb.save(temp_file)
         return temp_file
     
@@ -468,8 +617,7 @@ def build_no_post_email(men, women, date_str):
 
 def send_email(subject, body, to_email, attachment_paths=None):
     """Send email with optional Excel attachments."""
-    creds = get_google_creds()
-    service = build('gmail', 'v1', credentials=creds)
+    service = get_service('gmail', 'v1')
     
     # Create message container
     message = MIMEMultipart()
@@ -502,102 +650,588 @@ def send_email(subject, body, to_email, attachment_paths=None):
             if os.path.exists(path):
                 os.remove(path)
 
+REMINDER_SHEET = 'RemindersSent'
+# Sent reminders are logged to RemindersSent in batches of at most this many
+REMINDER_LOG_BATCH = 10
+
+DEFAULT_REMINDER_TEMPLATE = """Hi $name,
+
+Our records show you played on $date but we could not find a posted score in GHIN.
+Please post your score for that round as soon as possible.
+
+Thank you,
+Handicap Committee
+"""
+
+def load_reminder_template():
+    """Return the current club's reminder template."""
+    path = current_club().reminder_template
+    if path:
+        with open(path) as f:
+            return Template(f.read())
+    return Template(DEFAULT_REMINDER_TEMPLATE)
+
+def send_reminder_emails(no_post_golfers, max_workers=4, sends_per_second=None):
+    """Email a "please post your score" reminder to each non-poster.
+
+    Reminders already listed in the RemindersSent tab for this date are
+    skipped, so re-running a day does not email anyone twice. Sent
+    reminders are logged in small batches as they complete, and sending
+    stops if the log can't be written. Sends go through a small worker
+    pool, throttled to stay under the Gmail quota.
+    """
+    club = current_club()
+    date_str = get_current_date()
+    if sends_per_second is None:
+        sends_per_second = float(os.getenv('REMINDER_SENDS_PER_SECOND', '2'))
+    service = get_service('sheets', 'v4')
+
+    try:
+        sent_rows = get_sheet_range(club.sheet_id, f'{REMINDER_SHEET}!A:C')
+    except Exception as e:
+        log(f"Error reading {REMINDER_SHEET}: {e}")
+        return 0
+    already_sent = {(row[0], row[2].lower()) for row in sent_rows[1:] if len(row) >= 3}
+
+    recipients = {}
+    for name in no_post_golfers:
+        email = get_roster_info(name)[2]
+        if email and (date_str, email.lower()) not in already_sent:
+            recipients.setdefault(email.lower(), (name, email))
+    if not recipients:
+        return 0
+
+    template = load_reminder_template()
+    interval = 1.0 / sends_per_second
+    next_slot = [time.monotonic()]
+    slot_lock = threading.Lock()
+    # Set when the log can't be written, so nothing else is sent unlogged
+    stop_sending = threading.Event()
+
+    def send_one(name, email):
+        _club_local.club = club
+        with slot_lock:
+            slot = max(time.monotonic(), next_slot[0])
+            next_slot[0] = slot + interval
+        time.sleep(max(0, slot - time.monotonic()))
+        if stop_sending.is_set():
+            return None
+
+        message = MIMEText(template.safe_substitute(name=name, date=date_str))
+        message['to'] = email
+        message['from'] = "me"
+        message['subject'] = f"Please post your score for {date_str}"
+        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+        # No automatic retries: a retried send after a 5xx can deliver twice
+        try:
+            get_service('gmail', 'v1').users().messages().send(
+                userId="me", body={'raw': raw}).execute()
+        finally:
+            release_services()
+        return [date_str, name, email]
+
+    needs_header = not sent_rows
+
+    def record_sent(rows):
+        """Append sent reminders to the log so a re-run skips them."""
+        nonlocal needs_header
+        values = ([['Date', 'Name', 'Email']] if needs_header else []) + rows
+        try:
+            service.spreadsheets().values().append(
+                spreadsheetId=club.sheet_id,
+                range=f'{REMINDER_SHEET}!A:C',
+                valueInputOption='RAW',
+                insertDataOption='INSERT_ROWS',
+                body={'values': values}
+            ).execute()
+            needs_header = False
+        except Exception as e:
+            stop_sending.set()
+            log(f"Error updating {REMINDER_SHEET}, stopping reminders; add these rows by hand "
+                f"or a re-run will remind them again: {rows}: {e}")
+
+    sent_count = 0
+    unlogged = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(send_one, name, email) for name, email in recipients.values()]
+        for future in as_completed(futures):
+            try:
+                row = future.result()
+            except Exception as e:
+                log(f"Error sending reminder: {e}")
+                continue
+            if row is None:
+                continue
+            sent_count += 1
+            unlogged.append(row)
+            if len(unlogged) >= REMINDER_LOG_BATCH:
+                record_sent(unlogged)
+                unlogged = []
+    if unlogged:
+        record_sent(unlogged)
+    invalidate_sheet(club.sheet_id, REMINDER_SHEET)
+    return sent_count
+
 def get_roster_name_by_ghin(ghin_number):
     """Look up a golfer's name in the roster by their GHIN number."""
-    if not hasattr(cache_sheet_data, 'roster'):
+    roster = get_roster()
+    if roster is None:
         return None
         
-    ghin_number = str(ghin_number).strip()
-    for row in cache_sheet_data.roster[1:]:  # Skip header
-        if len(row) > 1 and row[1] and str(row[1]).strip() == ghin_number:
-            return row[0]  # Return name from column A
-    return None
+    row_index = find_roster_row_by_ghin(roster, ghin_number)
+    return roster[row_index][0] if row_index is not None else None  # Name from column A
 
-if __name__ == "__main__":
-    # Cache sheet data at startup
-    print("Caching sheet data...")
-    if not cache_sheet_data():
-        print("Failed to cache sheet data. Exiting.")
-        sys.exit(1)
-    
-    # Test Gmail connection first
-    print("Testing Gmail connection...")
-    test_gmail_connection()
-    
+POST_PERCENTAGE_HEADER = ['Name', 'Rounds Posted', 'Rounds Not Posted', 'Other', 'Pct All', 'Pct Played']
+
+def format_percentage(numerator, denominator):
+    """Format a posting rate the way the PostPercentage tab displays it."""
+    if not denominator:
+        return ''
+    return f"{numerator / denominator:.2%}"
+
+def update_post_percentage(sheet_id, posted_golfers, no_post_golfers):
+    """Update PostPercentage rows for today's golfers, sending only changed rows."""
+    service = get_service('sheets', 'v4')
+    sheet_name = 'PostPercentage'
+    try:
+        existing_data = get_sheet_range(sheet_id, f'{sheet_name}!A:F')
+        updates = []
+        if not existing_data:
+            existing_data = [POST_PERCENTAGE_HEADER]
+            updates.append({'range': f'{sheet_name}!A1:F1', 'values': [POST_PERCENTAGE_HEADER]})
+
+        # Sheet row number (1-based) for each golfer already on the tab
+        row_numbers = {}
+        for index, row in enumerate(existing_data[1:], start=2):
+            if len(row) > 0 and row[0] not in row_numbers:
+                row_numbers[row[0]] = index
+
+        changed = {}
+        next_row = len(existing_data) + 1
+
+        def get_row(name):
+            nonlocal next_row
+            if name not in changed:
+                if name in row_numbers:
+                    row = list(existing_data[row_numbers[name] - 1])
+                    row_number = row_numbers[name]
+                else:
+                    row = [name]
+                    row_number = next_row
+                    next_row += 1
+                while len(row) < 6:
+                    row.append('')
+                changed[name] = (row_number, row)
+            return changed[name][1]
+
+        def increment(row, col):
+            row[col] = str(int(row[col]) + 1) if str(row[col]).isdigit() else '1'
+
+        for name in posted_golfers:
+            increment(get_row(name), 1)  # Rounds Posted (col B)
+        for name in no_post_golfers:
+            increment(get_row(name), 2)  # Rounds Not Posted (col C)
+
+        for row_number, row in changed.values():
+            posted, not_posted, other = (
+                int(row[col]) if str(row[col]).isdigit() else 0 for col in (1, 2, 3)
+            )
+            row[4] = format_percentage(posted, posted + not_posted + other)
+            row[5] = format_percentage(posted, posted + not_posted)
+            updates.append({
+                'range': f'{sheet_name}!A{row_number}:F{row_number}',
+                'values': [row[:6]]
+            })
+
+        if not updates:
+            return
+        service.spreadsheets().values().batchUpdate(
+            spreadsheetId=sheet_id,
+            body={'valueInputOption': 'USER_ENTERED', 'data': updates}
+        ).execute()
+        log(f"Updated {len(changed)} {sheet_name} rows")
+    except Exception as e:
+        log(f"Error updating {sheet_name}: {e}")
+    finally:
+        invalidate_sheet(sheet_id, sheet_name)
+
+def update_posting_history(sheet_id, posted_golfers, no_post_golfers):
+    """Append today's per-golfer posting outcomes to the PostingHistory tab."""
+    service = get_service('sheets', 'v4')
+    sheet_name = PostingHistory.SHEET_NAME
+    try:
+        # The header row carries the last recorded date, so detecting a re-run
+        # doesn't mean reading the whole, ever-growing date column
+        header = get_sheet_range(sheet_id, f'{sheet_name}!A1:F1')
+        header = header[0] if header else []
+        last_date = PostingHistory.parse_date(header[5]) if len(header) > 5 else None
+        if last_date is None and header:
+            # Tabs written before the marker existed need one full scan
+            existing_dates = get_sheet_range(sheet_id, f'{sheet_name}!A:A')
+            recorded = [PostingHistory.parse_date(row[0]) for row in existing_dates[1:] if row]
+            last_date = max((day for day in recorded if day), default=None)
+        if last_date and date <= last_date:
+            log(f"{sheet_name} already covers {last_date.strftime('%m-%d-%y')}; skipping {get_current_date()}")
+            return
+
+        rows = PostingHistory.day_rows(date, posted_golfers, no_post_golfers)
+        if not header:
+            rows = [PostingHistory.HEADER] + rows
+        if rows:
+            service.spreadsheets().values().append(
+                spreadsheetId=sheet_id,
+                range=f'{sheet_name}!A:D',
+                valueInputOption='RAW',
+                insertDataOption='INSERT_ROWS',
+                body={'values': rows}
+            ).execute()
+        service.spreadsheets().values().update(
+            spreadsheetId=sheet_id,
+            range=f'{sheet_name}!{PostingHistory.LAST_DATE_RANGE}',
+            valueInputOption='RAW',
+            body={'values': [[PostingHistory.LAST_DATE_LABEL, get_current_date()]]}
+        ).execute()
+    except Exception as e:
+        log(f"Error updating {sheet_name}: {e}")
+    finally:
+        invalidate_sheet(sheet_id, sheet_name)
+
+def iter_checkable_golfers(tee_rows):
+    """Yield each golfer's first tee sheet row once their tee time has a group.
+
+    Solo tee times are skipped. Rows are held only until a second row for
+    the same tee time arrives, so checking starts before the tee sheet has
+    been fully read and memory is bounded by the number of tee times.
+    """
+    checked_golfers = set()
+    tee_time_counts = {}
+    waiting = {}
+    for golfer in tee_rows:
+        # Use GHIN if available, otherwise fallback to name
+        unique_id = golfer[3] if golfer[3] else removeAfterCharacter(golfer[2], '-')
+        first_row = unique_id not in checked_golfers
+        checked_golfers.add(unique_id)
+        if len(golfer) <= 1:
+            continue
+
+        tee_time = golfer[1]
+        tee_time_counts[tee_time] = tee_time_counts.get(tee_time, 0) + 1
+        if first_row:
+            waiting.setdefault(tee_time, []).append(golfer)
+        if tee_time_counts[tee_time] > 1:
+            yield from waiting.pop(tee_time, [])
+
+def get_identity_map():
+    """The current club's learned MTech identity -> roster row links."""
+    club = current_club()
+    if club.identity_map is None:
+        club.identity_map = IdentityMap(club.cache_dir / 'identity_map.json')
+    return club.identity_map
+
+def resolve_golfer(golfer):
+    """Resolve a tee sheet row against ExcludedDates and the roster.
+
+    None of this needs the GHIN report, so live mode can work it out ahead
+    of time. Returns a JSON-serializable dict; `ghin` is the number to check
+    posting for, and `no_ghin` marks golfers with no GHIN anywhere.
+    """
+    if is_time_excluded(golfer[1]):
+        return {'excluded': True}
+
+    # Confirmed links from earlier runs resolve with one lookup; only new
+    # identities (or ones whose roster row changed) scan the roster
+    roster = get_roster() or []
+    identities = get_identity_map()
+    mtech_name = removeAfterCharacter(golfer[2], '-')
+    key = IdentityMap.key(golfer[3], normalize_name(mtech_name))
+    row_index = identities.lookup(key, roster)
+    if row_index is None:
+        if golfer[3] != "":
+            row_index = find_roster_row_by_ghin(roster, golfer[3])
+        else:
+            row_index = find_roster_row(roster, mtech_name)
+        if row_index is not None:
+            identities.learn(key, row_index, roster[row_index])
+
+    if golfer[3] != "":
+        # Get the canonical name from roster if GHIN exists, else fall back to the MTech name
+        if row_index is not None:
+            golfer_name = roster[row_index][0]
+        else:
+            golfer_name = mtech_name
+            row_index = find_roster_row(roster, mtech_name)
+        ghin = golfer[3]
+    else:
+        golfer_name = mtech_name
+
+    if row_index is not None:
+        has_ghin, email, gender, member_number = roster_row_info(roster[row_index])
+    else:
+        has_ghin, email, gender, member_number = False, None, None, None
+    if golfer[3] == "":
+        if not has_ghin:
+            return {'excluded': False, 'name': golfer_name, 'no_ghin': True}
+        ghin = roster[row_index][1].strip()
+
+    return {
+        'excluded': False,
+        'name': golfer_name,
+        'no_ghin': False,
+        'ghin': ghin,
+        'email': email,
+        'gender': (gender or '').strip().upper(),
+        'member_number': member_number,
+    }
+
+def reconcile_resolved(resolutions):
+    """Check posting for resolved golfers.
+
+    Returns (posted_golfers, noPost, noGHIN, men_no_post, women_no_post).
+    """
     noGHIN = []
     noPost = []
-    tee_data = getMTechData()
-    
-    print(f"Checking golf rounds for {date.strftime('%m-%d-%y')}")
-    print(f"Looking for USGA report email from {(date + datetime.timedelta(days=1)).strftime('%m-%d-%y')}")
-    
-    # Collect all golfer[1] values to check for duplicates
-    all_golfer_values = [g[1] for g in tee_data if len(g) > 1]
-    
     men_no_post = []
     women_no_post = []
     posted_golfers = []
 
-    checked_golfers = set()
+    for resolution in resolutions:
+        if resolution['excluded']:
+            continue
+        golfer_name = resolution['name']
+        if resolution['no_ghin']:
+            noGHIN.append(golfer_name)
+        elif resolution['ghin'] and checkPosting(resolution['ghin']):
+            posted_golfers.append(golfer_name)
+        else:
+            noPost.append(golfer_name)
+            no_post_entry = (golfer_name, resolution['email'], resolution['member_number'])
+            if resolution['gender'] == "M":
+                men_no_post.append(no_post_entry)
+            elif resolution['gender'] == "F":
+                women_no_post.append(no_post_entry)
 
-    for golfer in tee_data:
-        # Use GHIN if available, otherwise fallback to name
-        unique_id = golfer[3] if golfer[3] else removeAfterCharacter(golfer[2], '-')
-        if unique_id in checked_golfers:
+    return posted_golfers, noPost, noGHIN, men_no_post, women_no_post
+
+def reconcile(tee_data):
+    """Compare who played against who posted.
+
+    tee_data may be any iterable of tee sheet rows, including the lazy
+    getMTechData() stream. Returns
+    (posted_golfers, noPost, noGHIN, men_no_post, women_no_post).
+    """
+    return reconcile_resolved(resolve_golfer(golfer) for golfer in iter_checkable_golfers(tee_data))
+
+def live_tracker_path():
+    return current_club().cache_dir / f'live-{date.isoformat()}.json'
+
+def reference_fingerprint():
+    """Hash of the roster and ExcludedDates that golfer resolutions depend on."""
+    club = current_club()
+    reference = [get_roster(), get_sheet_range(club.sheet_id, EXCLUDED_DATES_RANGE)]
+    return hashlib.sha1(json.dumps(reference).encode('utf-8')).hexdigest()
+
+def refresh_tracker_reference(tracker):
+    """Re-resolve every golfer if the roster or ExcludedDates changed."""
+    fingerprint = reference_fingerprint()
+    if tracker.reference != fingerprint:
+        tracker.resolve_all()
+        tracker.reference = fingerprint
+
+def load_live_tracker():
+    """Load the tee sheet tracker saved by live mode for this date, if any."""
+    path = live_tracker_path()
+    if not path.exists():
+        return None
+    try:
+        tracker = TeeSheetTracker.load(path, resolve_golfer)
+    except (OSError, ValueError) as e:
+        log(f"Ignoring unreadable live state {path}: {e}")
+        return None
+    refresh_tracker_reference(tracker)
+    return tracker
+
+def run_live(club, interval_seconds=300):
+    """Poll today's tee sheet and keep its resolved golfers up to date.
+
+    Each poll only re-resolves golfers whose tee sheet rows were added or
+    changed, and saves the tracker so the next morning's run only has to
+    check posting.
+    """
+    _club_local.club = club
+    client = MTechClient(club.mtech_api_key, session=http_session)
+    tracker = load_live_tracker() or TeeSheetTracker(resolve_golfer)
+    path = live_tracker_path()
+    log(f"Live monitoring {date.strftime('%m-%d-%y')} every {interval_seconds}s (Ctrl-C to stop)")
+    while datetime.date.today() <= date:
+        try:
+            if cache_sheet_data():
+                refresh_tracker_reference(tracker)
+                added, removed, resolved = tracker.update(client.get_tee_times(date))
+                tracker.save(path)
+                get_identity_map().save()
+                log(f"{datetime.datetime.now():%H:%M:%S} tee sheet: +{added} -{removed} rows, "
+                      f"{resolved} golfers resolved, {sum(1 for _ in tracker.checkable())} to check")
+        except Exception as e:
+            log(f"Error polling tee sheet: {e}")
+        time.sleep(interval_seconds)
+
+def load_archive_inputs(archive):
+    """Point the current club's caches at an archive's roster and ExcludedDates snapshots."""
+    club = current_club()
+    club.archive = archive
+    club.cache.clear()
+    club.cache.set((club.roster_sheet_id, None, ROSTER_RANGE),
+                   archive.get_json(RunArchive.ROSTER) or [])
+    club.cache.set((club.sheet_id, None, EXCLUDED_DATES_RANGE),
+                   archive.get_json(RunArchive.EXCLUDED_DATES) or [])
+
+def replay_dates(start_date, end_date):
+    """Re-run the reconciliation for archived dates without any network access."""
+    global date
+    club = current_club()
+    results = {}
+    for archived_date in RunArchive.archived_dates(club.archive_dir):
+        if not start_date <= archived_date <= end_date:
             continue
-        checked_golfers.add(unique_id)
+        date = archived_date
+        load_archive_inputs(RunArchive(archived_date, club.archive_dir).load())
+        posted_golfers, noPost, noGHIN, _, _ = reconcile(getMTechData())
+        results[archived_date] = (posted_golfers, noPost, noGHIN)
+        print(f"{archived_date.strftime('%m-%d-%y')}: {len(posted_golfers)} posted, "
+              f"{len(noPost)} not posted, {len(noGHIN)} no GHIN")
+        if noPost:
+            print(f"  NoPost: {', '.join(noPost)}")
+        if noGHIN:
+            print(f"  NoGHIN: {', '.join(noGHIN)}")
+    return results
 
-        if len(golfer) > 1 and all_golfer_values.count(golfer[1]) > 1:
-            if not is_time_excluded(golfer[1]):
-                # Get the canonical name from roster if GHIN exists
-                canonical_name = None
-                if golfer[3]:  # If GHIN exists in MTech data
-                    canonical_name = get_roster_name_by_ghin(golfer[3])
-                if not canonical_name:  # Fallback to MTech name if no GHIN or not found in roster
-                    canonical_name = removeAfterCharacter(golfer[2], '-')
-                
-                if golfer[3] != "":
-                    if checkPosting(golfer[3]):
-                        posted_golfers.append(canonical_name)
-                    else:
-                        noPost.append(canonical_name)
-                        exists, has_ghin, email, gender, member_number = get_roster_info(canonical_name)
-                        gender = (gender or '').strip().upper()
-                        if gender == "M":
-                            men_no_post.append((canonical_name, email, member_number))
-                        elif gender == "F":
-                            women_no_post.append((canonical_name, email, member_number))
-                        else:
-                            pass
-                elif golfer[3] == "":
-                    golfer_name = removeAfterCharacter(golfer[2], "-")
-                    exists_in_roster, has_ghin, email, gender, member_number = get_roster_info(golfer_name)
-                    if exists_in_roster and has_ghin:
-                        for row in cache_sheet_data.roster[1:]:
-                            if normalize_name(row[0]) == normalize_name(golfer_name):
-                                roster_ghin = row[1].strip()
-                                break
-                        else:
-                            roster_ghin = None
-                        if roster_ghin and checkPosting(roster_ghin):
-                            posted_golfers.append(golfer_name)
-                        else:
-                            noPost.append(golfer_name)
-                            gender = (gender or '').strip().upper()
-                            if gender == "M":
-                                men_no_post.append((golfer_name, email, member_number))
-                            elif gender == "F":
-                                women_no_post.append((golfer_name, email, member_number))
-                    else:
-                        noGHIN.append(golfer_name)
+_END_OF_ROWS = object()
+# Rows buffered between the MTech download and reconciliation
+TEE_QUEUE_SIZE = 500
+
+def start_input_fetches(club, executor):
+    """Start the Sheets, Gmail, MTech and GHIN fetches for a run all at once.
+
+    None of them depend on each other. Returns (futures, timings, tee_rows,
+    stop_download) where tee_rows lazily yields MTech rows as the background
+    download produces them, and timings fills in as each fetch finishes.
+    Only TEE_QUEUE_SIZE rows are buffered, so the caller must set
+    stop_download if it stops reading tee_rows before the end.
+    """
+    timings = {}
+    tee_queue = queue.Queue(maxsize=TEE_QUEUE_SIZE)
+    stop_download = threading.Event()
+
+    def timed(name, fn):
+        def run():
+            _club_local.club = club
+            start = time.monotonic()
+            try:
+                return fn()
+            finally:
+                timings[name] = time.monotonic() - start
+                release_services()
+        return executor.submit(run)
+
+    def put(item):
+        """Queue an item, giving up once the reader has stopped."""
+        while not stop_download.is_set():
+            try:
+                tee_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def download_tee_sheet():
+        rows = getMTechData()
+        try:
+            for row in rows:
+                if not put(row):
+                    return
+        except Exception as e:
+            put(e)
+            raise
+        finally:
+            rows.close()
+            put(_END_OF_ROWS)
+
+    def tee_rows():
+        while True:
+            row = tee_queue.get()
+            if row is _END_OF_ROWS:
+                return
+            if isinstance(row, Exception):
+                raise row
+            yield row
+
+    futures = {
+        'Sheets': timed('Sheets', cache_sheet_data),
+        'Gmail': timed('Gmail', test_gmail_connection),
+        'MTech': timed('MTech', download_tee_sheet),
+        # Warms the USGA cache; checkPosting waits on this in-flight load
+        'GHIN': timed('GHIN', getUSGAData),
+    }
+    return futures, timings, tee_rows(), stop_download
+
+def log_critical_path(futures, timings):
+    """Wait for every input fetch and print how long each took."""
+    wait(futures.values())
+    parts = ', '.join(f"{name} {timings.get(name, 0):.1f}s" for name in futures)
+    slowest = max(futures, key=lambda name: timings.get(name, 0))
+    log(f"Input fetches: {parts}; critical path: {slowest} ({timings.get(slowest, 0):.1f}s)")
+
+def run_club(club, record=False, remind=False):
+    """Run the full daily check for one club on the current thread."""
+    _club_local.club = club
+    if record:
+        club.archive = RunArchive(date, club.archive_dir)
+
+    log(f"Checking golf rounds for {date.strftime('%m-%d-%y')}")
+    report_dates = get_report_dates()
+    if len(report_dates) == 1:
+        log(f"Looking for GHIN report email from {report_dates[0].strftime('%m-%d-%y')}")
+    else:
+        log(f"Looking for GHIN report emails from {report_dates[0].strftime('%m-%d-%y')} "
+            f"to {min(report_dates[-1], datetime.date.today()).strftime('%m-%d-%y')}"
+            + (" (later reports in the window are not due yet)" if report_dates[-1] > datetime.date.today() else ""))
     
-    print('Handicap report done for ' + datetime.date.strftime(date, "%m-%d-%y"))
+    # Fetch sheet data, test Gmail, and download the tee sheet and GHIN reports together
+    log("Fetching sheet data, Gmail, MTech and GHIN inputs...")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures, timings, tee_data, stop_download = start_input_fetches(club, executor)
+        try:
+            if not futures['Sheets'].result():
+                log("Failed to cache sheet data. Exiting.")
+                return False
+        
+            # Reuse golfers already resolved by live mode, diffing in any late changes;
+            # otherwise the tee sheet streams in while the roster checks run
+            tracker = load_live_tracker()
+            if tracker:
+                added, removed, resolved = tracker.update(tee_data)
+                log(f"Using live state: +{added} -{removed} rows since last poll, {resolved} golfers resolved")
+                results = reconcile_resolved(tracker.checkable())
+            else:
+                results = reconcile(tee_data)
+            posted_golfers, noPost, noGHIN, men_no_post, women_no_post = results
+        finally:
+            # Unblock the tee sheet download if it was not read to the end
+            stop_download.set()
+        log_critical_path(futures, timings)
+
+    identities = get_identity_map()
+    identities.save()
+    log(f"Identity map: {identities.hits} golfers matched, {identities.learned} links learned")
+
+    if club.archive:
+        club.archive.save()
+        log(f"Recorded run inputs to {club.archive.path}")
     
-    # Make sure we have a reports directory
-    Path('reports').mkdir(parents=True, exist_ok=True)
+    log('Handicap report done for ' + datetime.date.strftime(date, "%m-%d-%y"))
     
     # Replace the Excel report updates with Google Sheets updates
-    SPREADSHEET_ID = os.getenv('GOOGLE_SHEET_ID')
+    SPREADSHEET_ID = club.sheet_id
     
     # Update both sheets
     update_google_sheet(SPREADSHEET_ID, 'NoPost', noPost)
@@ -619,65 +1253,80 @@ if __name__ == "__main__":
     send_email(
         subject=f"Non-Posters for {date_str}",
         body=body,
-        to_email="John.Paradise117@gmail.com",
+        to_email=club.report_email,
         attachment_paths=excel_files
     )
-    print("Summary email sent with Excel attachment(s).")
+    log("Summary email sent with Excel attachment(s).")
+
+    if remind:
+        sent_count = send_reminder_emails(noPost)
+        log(f"Sent {sent_count} reminder email(s).")
+
+    update_post_percentage(SPREADSHEET_ID, posted_golfers, noPost)
+    update_posting_history(SPREADSHEET_ID, posted_golfers, noPost)
+
+    # This run changed the main spreadsheet, so its snapshot is stale
+    get_snapshot_loader().invalidate(SPREADSHEET_ID)
+    return True
+
+def run_club_task(club, record=False, remind=False):
+    """run_club on a pool thread, returning its services to the shared pool after."""
+    try:
+        return run_club(club, record, remind)
+    finally:
+        release_services()
+
+def run_clubs(clubs, record=False, remind=False):
+    """Run every club's daily check concurrently; returns {club name: succeeded}."""
+    results = {}
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=len(clubs)) as executor:
+        futures = {executor.submit(run_club_task, club, record, remind): club for club in clubs}
+        for future, club in futures.items():
+            try:
+                results[club.name] = future.result()
+            except Exception as e:
+                print(f"[{club.name}] Error running handicap check: {e}")
+                results[club.name] = False
+    for name, succeeded in results.items():
+        print(f"[{name}] {'done' if succeeded else 'FAILED'}")
+    print(f"Checked {len(clubs)} clubs in {time.monotonic() - start:.1f}s")
+    return results
 
-    # Update PostPercentage sheet
-    def update_post_percentage(sheet_id, posted_golfers, no_post_golfers):
-        creds = get_google_creds()
-        service = build('sheets', 'v4', credentials=creds)
-        sheet_name = 'PostPercentage'
+if __name__ == "__main__":
+    # Optional modes: --record saves this run's raw inputs to archive/,
+    # --replay [end-date] re-runs archived dates offline with no outputs,
+    # --clubs <clubs.json> runs every configured club concurrently,
+    # --remind emails a posting reminder to each non-poster,
+    # --live [seconds] polls the date's tee sheet and pre-resolves golfers
+    mode_args = sys.argv[2:]
+    if '--replay' in mode_args:
+        end_args = mode_args[mode_args.index('--replay') + 1:]
+        end_date = date
+        if end_args:
+            try:
+                end_date = datetime.datetime.strptime(end_args[0], '%m-%d-%Y').date()
+            except ValueError:
+                end_date = datetime.datetime.strptime(end_args[0], '%m-%d-%y').date()
+        if not replay_dates(date, end_date):
+            print("No archived runs found for that date range.")
+        sys.exit(0)
+
+    if '--live' in mode_args:
+        interval_args = mode_args[mode_args.index('--live') + 1:]
+        interval = int(interval_args[0]) if interval_args and interval_args[0].isdigit() else 300
         try:
-            result = service.spreadsheets().values().get(
-                spreadsheetId=sheet_id,
-                range=f'{sheet_name}!A:F'
-            ).execute()
-            existing_data = result.get('values', [])
-            if not existing_data:
-                existing_data = [['Name', 'Rounds Posted', 'Rounds Not Posted', 'Other', 'Pct All', 'Pct Played']]
-            data_dict = {row[0]: row for row in existing_data[1:] if len(row) > 0}
-            # Update posted
-            for name in posted_golfers:
-                if name in data_dict:
-                    row = data_dict[name]
-                    # Ensure row has at least 3 columns
-                    while len(row) < 6:
-                        row.append('')
-                    # Increment posted count (col B)
-                    row[1] = str(int(row[1]) + 1) if len(row) > 1 and row[1].isdigit() else '1'
-                else:
-                    data_dict[name] = [name, '1', '', '', '', '']
-            # Update not posted
-            for name in no_post_golfers:
-                if name in data_dict:
-                    row = data_dict[name]
-                    # Ensure row has at least 3 columns
-                    while len(row) < 6:
-                        row.append('')
-                    # Increment not posted count (col C)
-                    row[2] = str(int(row[2]) + 1) if len(row) > 2 and row[2].isdigit() else '1'
-                else:
-                    data_dict[name] = [name, '', '1', '', '', '']
-            # Prepare final data
-            final_data = [existing_data[0]]
-            for row in data_dict.values():
-                # Ensure row has at least 6 columns
-                while len(row) < 6:
-                    row.append('')
-                # Row number in sheet is index+2 (header is row 1)
-                row_idx = len(final_data) + 1
-                row[4] = f"=B{row_idx}/(B{row_idx}+C{row_idx}+D{row_idx})"
-                row[5] = f"=B{row_idx}/(B{row_idx}+C{row_idx})"
-                final_data.append(row)
-            # Update sheet
-            service.spreadsheets().values().update(
-                spreadsheetId=sheet_id,
-                range=f'{sheet_name}!A1',
-                valueInputOption='USER_ENTERED',
-                body={'values': final_data}
-            ).execute()
-        except Exception as e:
-            print(f"Error updating {sheet_name}: {e}")
-    update_post_percentage(SPREADSHEET_ID, posted_golfers, noPost)
\ No newline at end of file
+            run_live(default_club, interval)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    record = '--record' in mode_args
+    remind = '--remind' in mode_args
+    if '--clubs' in mode_args:
+        clubs = Club.load_all(mode_args[mode_args.index('--clubs') + 1])
+        results = run_clubs(clubs, record, remind)
+        sys.exit(0 if all(results.values()) else 1)
+
+    if not run_club(default_club, record, remind):
+        sys.exit(1)
@@ -6,13 +6,18 @@ from dotenv import load_dotenv
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 import pickle
 import re
+import datetime
+from src.stats.posting_history import PostingHistory
+from src.sheets.sheet_loader import SheetSnapshotLoader
 
 load_dotenv()
 
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets.readonly',
+    'https://www.googleapis.com/auth/drive.metadata.readonly'
+]
 
 def get_google_creds():
     creds = None
@@ -35,15 +40,7 @@ def normalize_name(name):
     # Remove leading/trailing whitespace and collapse multiple spaces/tabs
     return re.sub(r'\s+', ' ', name).strip()
 
-def get_post_percentage_dict(sheet_id):
-    creds = get_google_creds()
-    service = build('sheets', 'v4', credentials=creds)
-    sheet_name = 'PostPercentage'
-    result = service.spreadsheets().values().get(
-        spreadsheetId=sheet_id,
-        range=f'{sheet_name}!A:F'
-    ).execute()
-    values = result.get('values', [])
+def get_post_percentage_dict(values):
     post_percentage = {}
     for row in values[1:]:
         if len(row) >= 6:
@@ -60,15 +57,7 @@ def get_post_percentage_dict(sheet_id):
             post_percentage[name] = pct_val
     return post_percentage
 
-def get_roster_dict(roster_sheet_id):
-    creds = get_google_creds()
-    service = build('sheets', 'v4', credentials=creds)
-    sheet_name = 'Sheet1'  # Assuming Sheet1 is the roster sheet
-    result = service.spreadsheets().values().get(
-        spreadsheetId=roster_sheet_id,
-        range=f'{sheet_name}!A:E'
-    ).execute()
-    values = result.get('values', [])
+def get_roster_dict(values):
     roster_dict = {}
     for row in values[1:]:
         if len(row) >= 5:
@@ -78,10 +67,12 @@ def get_roster_dict(roster_sheet_id):
     return roster_dict
 
 if len(sys.argv) < 2:
-    print("Usage: python handicap_check_report.py <spreadsheet_path>")
+    print("Usage: python handicap_check_report.py <spreadsheet_path> [window_days]")
     sys.exit(1)
 
 spreadsheet_path = sys.argv[1]
+# Optional rolling window in days; lifetime PostPercentage is used when omitted
+window_days = int(sys.argv[2]) if len(sys.argv) > 2 else None
 wb = openpyxl.load_workbook(spreadsheet_path)
 sheet = wb.active
 
@@ -100,10 +91,22 @@ roster_sheet_id = os.getenv('ROSTER_SHEET_ID')
 if not roster_sheet_id:
     roster_sheet_id = input('Enter your Roster Google Sheet ID: ').strip()
 
-post_percentage = get_post_percentage_dict(sheet_id)
+# Fetch posting data and the entire roster together (Sheet1 is the roster sheet)
+if window_days:
+    posting_range = (sheet_id, f'{PostingHistory.SHEET_NAME}!A:D')
+else:
+    posting_range = (sheet_id, 'PostPercentage!A:F')
+roster_range = (roster_sheet_id, 'Sheet1!A:E')
+sheet_data = SheetSnapshotLoader(get_google_creds()).load([posting_range, roster_range])
+
+if window_days:
+    posting_history = PostingHistory.from_rows(sheet_data[posting_range])
+    today = datetime.date.today()
+else:
+    post_percentage = get_post_percentage_dict(sheet_data[posting_range])
 
-# Fetch the entire roster once and build a lookup dict
-roster_dict = get_roster_dict(roster_sheet_id)
+# Build a lookup dict from the roster
+roster_dict = get_roster_dict(sheet_data[roster_range])
 
 golfer_names = []
 for member_number in member_numbers:
@@ -115,7 +118,10 @@ for member_number in member_numbers:
 report_golfers = []
 no_history_golfers = []
 for name in golfer_names:
-    pct = post_percentage.get(name)
+    if window_days:
+        pct = posting_history.posting_rate(name, today, window_days)
+    else:
+        pct = post_percentage.get(name)
     if pct is not None and pct < 100:
         report_golfers.append((name, pct))
     elif pct is None:
@@ -136,14 +142,23 @@ doc_title = doc_name
 if doc_title.lower().endswith('.docx'):
     doc_title = doc_title[:-5]
 doc.add_heading(doc_title, 0)
-doc.add_paragraph('Golfers with less than 100% Post Percentage:')
+period = f" (last {window_days} days)" if window_days else ''
+doc.add_paragraph(f'Golfers with less than 100% Post Percentage{period}:')
 for name, pct in report_golfers:
     doc.add_paragraph(f"{name}: {pct:.0f}%", style='List Bullet')
 
 doc.add_paragraph('')
-doc.add_paragraph('Golfers that have not played a round:')
+doc.add_paragraph(f'Golfers that have not played a round{period}:')
 for name in no_history_golfers:
     doc.add_paragraph(f"{name}", style='List Bullet')
 
+if window_days:
+    repeat_misses = posting_history.repeat_non_posters(today, window_days)
+    doc.add_paragraph('')
+    doc.add_paragraph(f'Golfers who did not post at least twice{period}:')
+    for name in golfer_names:
+        if name in repeat_misses:
+            doc.add_paragraph(f"{name}: {repeat_misses[name]} rounds not posted", style='List Bullet')
+
 doc.save(doc_path)
 print(f"Report saved to {doc_path}")
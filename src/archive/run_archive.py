@@ -0,0 +1,70 @@
+import datetime
+import json
+import zipfile
+from datetime import date
+from pathlib import Path
+
+class RunArchive:
+    """Compressed per-date archive of a run's raw inputs for offline replay."""
+
+    MTECH_CSV = 'mtech.csv'
+    # Runs recorded before multi-day GHIN reports kept a single ghin.xlsx
+    GHIN_XLSX = 'ghin.xlsx'
+    ROSTER = 'roster.json'
+    EXCLUDED_DATES = 'excluded_dates.json'
+
+    def __init__(self, target_date: date, archive_dir='archive'):
+        self.target_date = target_date
+        self.archive_dir = Path(archive_dir)
+        self.path = self.archive_dir / f'{target_date.isoformat()}.zip'
+        self.replaying = False
+        self._members = {}
+
+    @staticmethod
+    def ghin_report_name(report_date: date) -> str:
+        """Archive member name for the GHIN report emailed on report_date."""
+        return f'ghin-{report_date.isoformat()}.xlsx'
+
+    def put(self, name: str, data: bytes):
+        """Stage a raw input to be written on save()."""
+        self._members[name] = data
+
+    def put_json(self, name: str, value):
+        self.put(name, json.dumps(value).encode('utf-8'))
+
+    def get(self, name: str):
+        """Return a raw input, or None if it was not recorded."""
+        return self._members.get(name)
+
+    def get_json(self, name: str):
+        data = self.get(name)
+        return json.loads(data.decode('utf-8')) if data is not None else None
+
+    def save(self):
+        """Write all staged inputs to the date's zip archive."""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+        with zipfile.ZipFile(temp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, data in self._members.items():
+                archive.writestr(name, data)
+        temp_path.replace(self.path)
+
+    def load(self):
+        """Load a recorded archive and switch to replay mode."""
+        if not self.path.exists():
+            raise FileNotFoundError(f"No archived run for date {self.target_date}")
+        with zipfile.ZipFile(self.path) as archive:
+            self._members = {name: archive.read(name) for name in archive.namelist()}
+        self.replaying = True
+        return self
+
+    @staticmethod
+    def archived_dates(archive_dir='archive'):
+        """Return the sorted dates that have a recorded archive."""
+        dates = []
+        for path in Path(archive_dir).glob('*.zip'):
+            try:
+                dates.append(datetime.date.fromisoformat(path.stem))
+            except ValueError:
+                continue
+        return sorted(dates)
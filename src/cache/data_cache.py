@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+class DataCache:
+    """Thread-safe LRU cache with a TTL, keyed by (source, date, range) tuples.
+
+    `source` is a spreadsheet ID or other data source name, `date` is the
+    run date for date-specific data (None otherwise) and `range` is the
+    sheet range or other sub-key within that source.
+    """
+
+    def __init__(self, max_entries=256, ttl_seconds=None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.RLock()
+        self._loading = {}  # key -> lock held while its loader runs
+
+    def _expired(self, stored_at):
+        return self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds
+
+    def get(self, key, default=None):
+        """Return a cached value, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            stored_at, value = entry
+            if self._expired(stored_at):
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key, loader):
+        """Return a cached value, calling loader() to fill it on a miss.
+
+        Concurrent callers for the same key wait for a single load. If
+        loader raises, nothing is cached and the error propagates.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                value = loader()
+                self.set(key, value)
+        with self._lock:
+            self._loading.pop(key, None)
+        return value
+
+    def invalidate(self, source=None, date=None, range_prefix=None):
+        """Drop every entry matching all of the given key parts; returns the count."""
+        with self._lock:
+            matches = [
+                key for key in self._entries
+                if (source is None or key[0] == source)
+                and (date is None or key[1] == date)
+                and (range_prefix is None or str(key[2]).startswith(range_prefix))
+            ]
+            for key in matches:
+                del self._entries[key]
+            return len(matches)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
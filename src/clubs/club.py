@@ -0,0 +1,68 @@
+import json
+import os
+from pathlib import Path
+from src.cache.data_cache import DataCache
+
+class Club:
+    """One club's configuration plus the caches for its daily run.
+
+    Every club gets its own sheet and USGA cache and its own archive,
+    report, USGA report and snapshot directories, so several clubs can
+    run in the same process without sharing state.
+    """
+
+    def __init__(self, name, mtech_api_key, sheet_id, roster_sheet_id,
+                 gmail_user='nhcchandicapcheck@gmail.com',
+                 report_email='John.Paradise117@gmail.com',
+                 token_path='token.json', reminder_template=None,
+                 posting_grace_days=1, data_subdir=''):
+        self.name = name
+        self.mtech_api_key = mtech_api_key
+        self.sheet_id = sheet_id
+        self.roster_sheet_id = roster_sheet_id
+        self.gmail_user = gmail_user
+        self.report_email = report_email
+        self.token_path = token_path
+        self.reminder_template = reminder_template
+        # Round date D counts as posted if the GHIN shows up in any report from D+1 to D+N
+        self.posting_grace_days = int(posting_grace_days)
+        if self.posting_grace_days < 1:
+            raise ValueError(f"Club {name}: posting_grace_days must be at least 1, "
+                             f"got {posting_grace_days}")
+        self.archive_dir = Path('archive') / data_subdir
+        self.reports_dir = Path('reports') / data_subdir
+        self.cache_dir = Path('.cache') / data_subdir
+        self.usga_dir = Path('usgaReports') / data_subdir
+
+        # Sheet ranges and USGA posting indexes, keyed by (source, date, range)
+        self.cache = DataCache(max_entries=256, ttl_seconds=900)
+        self.archive = None
+        # Learned MTech identity -> roster links, loaded on first use
+        self.identity_map = None
+
+    @classmethod
+    def from_env(cls):
+        """Build the single club configured through environment variables."""
+        return cls(
+            name=os.getenv('CLUB_NAME', 'default'),
+            mtech_api_key=os.getenv('MTECH_API_KEY'),
+            sheet_id=os.getenv('GOOGLE_SHEET_ID'),
+            roster_sheet_id=os.getenv('ROSTER_SHEET_ID'),
+            gmail_user=os.getenv('GMAIL_USER', 'nhcchandicapcheck@gmail.com'),
+            report_email=os.getenv('REPORT_EMAIL', 'John.Paradise117@gmail.com'),
+            reminder_template=os.getenv('REMINDER_TEMPLATE'),
+            posting_grace_days=os.getenv('POSTING_GRACE_DAYS', '1'),
+        )
+
+    @classmethod
+    def load_all(cls, config_path):
+        """Load clubs from a JSON list of club settings."""
+        with open(config_path) as f:
+            configs = json.load(f)
+        clubs = []
+        for config in configs:
+            if 'name' not in config:
+                raise ValueError(f"Club config in {config_path} is missing 'name'")
+            config.setdefault('data_subdir', config['name'])
+            clubs.append(cls(**config))
+        return clubs
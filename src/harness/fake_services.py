@@ -0,0 +1,288 @@
+import base64
+import io
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+import openpyxl
+
+def column_index(letters: str) -> int:
+    """Zero-based index of a column letter such as 'A' or 'AC'."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - ord('A') + 1)
+    return index - 1
+
+def split_range(sheet_range: str):
+    """Split 'Tab!A5:F5' into ('Tab', first column, last column or None, first row or None)."""
+    tab, _, cells = sheet_range.partition('!')
+    match = re.match(r'([A-Z]+)(\d*)(?::([A-Z]+)\d*)?$', cells or 'A')
+    if not match:
+        return tab, 0, None, None
+    first_col = column_index(match.group(1))
+    last_col = column_index(match.group(3)) if match.group(3) else None
+    first_row = int(match.group(2)) if match.group(2) else None
+    return tab, first_col, last_col, first_row
+
+def build_ghin_report(ghin_numbers) -> bytes:
+    """Build an xlsx shaped like the GHIN Played / Posted report."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['GHIN Number', 'Player Name'])
+    for ghin in ghin_numbers:
+        sheet.append([ghin, f'Player {ghin}'])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+class FakeServiceState:
+    """In-memory data behind the fake MTech, Gmail, Sheets and Drive endpoints."""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, rate_limit_rate=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        # spreadsheet ID -> tab name -> rows
+        self.spreadsheets = {}
+        self.versions = Counter()
+        # (MTech API key, 'M-D-YYYY') -> tee sheet CSV text
+        self.tee_sheets = {}
+        # 'YYYY-MM-DD' -> xlsx bytes of the GHIN report emailed that day
+        self.ghin_reports = {}
+        self.sent_messages = []
+        self.requests = Counter()
+
+    def set_tab(self, spreadsheet_id, tab, rows):
+        with self.lock:
+            self.spreadsheets.setdefault(spreadsheet_id, {})[tab] = [list(row) for row in rows]
+            self.versions[spreadsheet_id] += 1
+
+    def get_tab(self, spreadsheet_id, tab):
+        with self.lock:
+            return [list(row) for row in self.spreadsheets.get(spreadsheet_id, {}).get(tab, [])]
+
+    def injected_status(self):
+        """Sleep for the configured latency and pick an injected failure, if any."""
+        delay = self.latency_ms + self.random.uniform(0, self.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000.0)
+        roll = self.random.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500
+        return None
+
+    # Sheets values endpoints
+
+    def values_get(self, spreadsheet_id, sheet_range):
+        tab, first_col, last_col, _ = split_range(sheet_range)
+        rows = self.get_tab(spreadsheet_id, tab)
+        end = last_col + 1 if last_col is not None else None
+        values = [row[first_col:end] for row in rows]
+        while values and not any(values[-1]):
+            values.pop()
+        result = {'range': sheet_range}
+        if values:
+            result['values'] = values
+        return result
+
+    def values_update(self, spreadsheet_id, sheet_range, values):
+        tab, first_col, _, first_row = split_range(sheet_range)
+        with self.lock:
+            rows = self.spreadsheets.setdefault(spreadsheet_id, {}).setdefault(tab, [])
+            start = (first_row or 1) - 1
+            for offset, new_row in enumerate(values):
+                while len(rows) <= start + offset:
+                    rows.append([])
+                row = rows[start + offset]
+                while len(row) < first_col + len(new_row):
+                    row.append('')
+                row[first_col:first_col + len(new_row)] = [str(v) for v in new_row]
+            self.versions[spreadsheet_id] += 1
+        return {'updatedRange': sheet_range, 'updatedRows': len(values)}
+
+    def values_clear(self, spreadsheet_id, sheet_range):
+        tab, first_col, last_col, _ = split_range(sheet_range)
+        with self.lock:
+            rows = self.spreadsheets.setdefault(spreadsheet_id, {}).setdefault(tab, [])
+            for row in rows:
+                end = last_col + 1 if last_col is not None else len(row)
+                row[first_col:end] = [''] * max(0, min(end, len(row)) - first_col)
+            self.versions[spreadsheet_id] += 1
+        return {'clearedRange': sheet_range}
+
+    def values_append(self, spreadsheet_id, sheet_range, values):
+        tab = split_range(sheet_range)[0]
+        with self.lock:
+            rows = self.spreadsheets.setdefault(spreadsheet_id, {}).setdefault(tab, [])
+            while rows and not any(rows[-1]):
+                rows.pop()
+            rows.extend([str(v) for v in row] for row in values)
+            self.versions[spreadsheet_id] += 1
+        return {'updates': {'updatedRows': len(values)}}
+
+class _FakeHandler(BaseHTTPRequestHandler):
+    """Routes requests to the fake MTech, Gmail, Sheets and Drive endpoints."""
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self) -> FakeServiceState:
+        return self.server.state
+
+    def _send(self, status, body, content_type='application/json'):
+        data = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}') if length else {}
+
+    def _handle(self, method):
+        url = urlparse(self.path)
+        path = unquote(url.path)
+        query = parse_qs(url.query)
+        endpoint = self._endpoint_name(method, path)
+        status = self.state.injected_status()
+        self.state.requests[(endpoint, status or 200)] += 1
+        if status:
+            message = 'Rate limit exceeded' if status == 429 else 'Backend error'
+            return self._send(status, {'error': {'code': status, 'message': message}})
+        try:
+            return self._route(method, path, query)
+        except KeyError as e:
+            return self._send(404, {'error': {'code': 404, 'message': f'Not found: {e}'}})
+
+    @staticmethod
+    def _endpoint_name(method, path):
+        if path.startswith('/cmtapi/'):
+            return 'mtech.teetimes'
+        if path.startswith('/drive/'):
+            return 'drive.files.get'
+        if path.startswith('/gmail/'):
+            if path.endswith('/send'):
+                return 'gmail.send'
+            if '/attachments/' in path:
+                return 'gmail.attachments.get'
+            return 'gmail.messages.get' if re.search(r'/messages/[^/]+$', path) else 'gmail.messages.list'
+        for suffix, name in ((':batchGet', 'sheets.batchGet'), (':batchUpdate', 'sheets.batchUpdate'),
+                             (':clear', 'sheets.clear'), (':append', 'sheets.append')):
+            if path.endswith(suffix):
+                return name
+        return 'sheets.update' if method == 'PUT' else 'sheets.get'
+
+    def _route(self, method, path, query):
+        state = self.state
+        if path.startswith('/cmtapi/teetimes'):
+            key = (query.get('apikey', [''])[0], query.get('TheDate', [''])[0])
+            csv_text = state.tee_sheets.get(key, 'TeeDate,TeeTime,Name,GHIN\n')
+            return self._send(200, csv_text.encode('utf-8'), 'text/csv')
+
+        match = re.match(r'/drive/v3/files/([^/]+)$', path)
+        if match:
+            return self._send(200, {'version': str(state.versions[match.group(1)])})
+
+        match = re.match(r'/gmail/v1/users/[^/]+/messages(.*)$', path)
+        if match:
+            return self._route_gmail(method, match.group(1), query)
+
+        match = re.match(r'/v4/spreadsheets/([^/]+)/values(?::(batchGet|batchUpdate)|/(.+))$', path)
+        if match:
+            spreadsheet_id, batch_action, sheet_range = match.groups()
+            if batch_action == 'batchGet':
+                return self._send(200, {'spreadsheetId': spreadsheet_id, 'valueRanges': [
+                    state.values_get(spreadsheet_id, r) for r in query.get('ranges', [])]})
+            if batch_action == 'batchUpdate':
+                data = self._read_json().get('data', [])
+                for value_range in data:
+                    state.values_update(spreadsheet_id, value_range['range'], value_range.get('values', []))
+                return self._send(200, {'spreadsheetId': spreadsheet_id, 'totalUpdatedRows': len(data)})
+            if sheet_range.endswith(':clear'):
+                return self._send(200, state.values_clear(spreadsheet_id, sheet_range[:-len(':clear')]))
+            if sheet_range.endswith(':append'):
+                body = self._read_json()
+                return self._send(200, state.values_append(
+                    spreadsheet_id, sheet_range[:-len(':append')], body.get('values', [])))
+            if method == 'PUT':
+                body = self._read_json()
+                return self._send(200, state.values_update(spreadsheet_id, sheet_range, body.get('values', [])))
+            return self._send(200, state.values_get(spreadsheet_id, sheet_range))
+        raise KeyError(path)
+
+    def _route_gmail(self, method, rest, query):
+        state = self.state
+        if rest == '/send':
+            body = self._read_json()
+            with state.lock:
+                state.sent_messages.append(body.get('raw', ''))
+                message_id = f'sent-{len(state.sent_messages)}'
+            return self._send(200, {'id': message_id})
+        if rest in ('', '/'):
+            search = query.get('q', [''])[0]
+            after = re.search(r'after:(\d{4})/(\d{2})/(\d{2})', search)
+            if not after:
+                return self._send(200, {'messages': [{'id': 'inbox-1'}]})
+            message_id = f'ghin-{after.group(1)}-{after.group(2)}-{after.group(3)}'
+            if message_id[len('ghin-'):] not in state.ghin_reports:
+                return self._send(200, {'resultSizeEstimate': 0})
+            return self._send(200, {'messages': [{'id': message_id}]})
+        match = re.match(r'/([^/]+)/attachments/([^/]+)$', rest)
+        if match:
+            report = state.ghin_reports[match.group(1)[len('ghin-'):]]
+            return self._send(200, {'data': base64.urlsafe_b64encode(report).decode()})
+        message_id = rest.strip('/')
+        state.ghin_reports[message_id[len('ghin-'):]]
+        return self._send(200, {'id': message_id, 'payload': {'headers': [], 'parts': [
+            {'filename': 'Played_Posted_Report.xlsx', 'body': {'attachmentId': f'att-{message_id}'}}]}})
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+class FakeServices:
+    """Local HTTP server standing in for MTech, Gmail, Sheets and Drive."""
+
+    def __init__(self, state: FakeServiceState, host='127.0.0.1', port=0):
+        self.state = state
+        self.server = ThreadingHTTPServer((host, port), _FakeHandler)
+        self.server.daemon_threads = True
+        self.server.state = state
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def api_endpoint(self, api_name: str) -> str:
+        """client_options api_endpoint that points googleapiclient at this server."""
+        if api_name == 'drive':
+            return f'{self.base_url}/drive/v3/'
+        return f'{self.base_url}/'
@@ -0,0 +1,137 @@
+"""Run the full app.py pipeline against local fake services over synthetic dates.
+
+Usage:
+    python -m src.harness.load_driver --days 30 --clubs 2 --latency-ms 40 --rate-limit-rate 0.02
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+from googleapiclient.discovery import build
+import httplib2
+from src.harness.fake_services import FakeServices, FakeServiceState, build_ghin_report
+
+ROSTER_HEADER = ['Name', 'GHIN', 'Email', 'Gender', 'MemberNo']
+
+def make_roster(size, rng, ghin_base=1000000):
+    """Synthetic roster rows: (name, GHIN, email, gender, member number)."""
+    roster = []
+    for i in range(size):
+        name = f'Golfer {i:04d}'
+        ghin = str(ghin_base + i)
+        roster.append([name, ghin, f'golfer{i:04d}@example.com', rng.choice('MF'), str(5000 + i)])
+    return roster
+
+def make_tee_sheet(round_date, roster, rng, players=80, guest_rate=0.05, missing_ghin_rate=0.1, post_rate=0.85):
+    """Build one day's MTech CSV and the set of GHINs that posted for it."""
+    lines = ['TeeDate,TeeTime,Name,GHIN']
+    posted = set()
+    golfers = rng.sample(roster, min(players, len(roster)))
+    tee_time = datetime.datetime.combine(round_date, datetime.time(7, 0))
+    for index, (name, ghin, _, _, _) in enumerate(golfers):
+        if index and index % 4 == 0:
+            tee_time += datetime.timedelta(minutes=10)
+        if rng.random() < guest_rate:
+            name, ghin = f'Guest {round_date:%m%d}{index}', ''
+        if ghin and rng.random() < post_rate:
+            posted.add(int(ghin))
+        ghin_for_row = ghin if rng.random() >= missing_ghin_rate else ''
+        lines.append(f'{round_date:%m/%d/%Y},{tee_time:%I:%M %p},{name}-Member,{ghin_for_row}')
+    return '\n'.join(lines) + '\n', posted
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--start', default='04-01-25', help='first round date, mm-dd-yy')
+    parser.add_argument('--days', type=int, default=14)
+    parser.add_argument('--clubs', type=int, default=1)
+    parser.add_argument('--roster-size', type=int, default=400)
+    parser.add_argument('--players', type=int, default=80, help='golfers on each tee sheet')
+    parser.add_argument('--latency-ms', type=float, default=20)
+    parser.add_argument('--jitter-ms', type=float, default=10)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with a 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='fraction of requests answered with a 429')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    start_date = datetime.datetime.strptime(args.start, '%m-%d-%y').date()
+    rng = random.Random(args.seed)
+    state = FakeServiceState(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate, seed=args.seed)
+    services = FakeServices(state).start()
+
+    # app.py reads the run date from argv at import time
+    sys.argv = [sys.argv[0], args.start]
+    import app
+    from src.clubs.club import Club
+
+    def fake_build(api_name, api_version, credentials=None, **kwargs):
+        return build(api_name, api_version, http=httplib2.Http(),
+                     client_options={'api_endpoint': services.api_endpoint(api_name)},
+                     static_discovery=True)
+
+    import src.sheets.sheet_loader as sheet_loader
+    app.build = fake_build
+    sheet_loader.build = fake_build
+    app.get_google_creds = lambda token_path=None: None
+    app.get_mtech_url = lambda: (f'{services.base_url}/cmtapi/teetimes/?apikey={app.current_club().mtech_api_key}'
+                                 f'&TheDate={app.date.month}-{app.date.day}-{app.date.year}')
+
+    # Synthetic clubs, rosters, tee sheets and GHIN reports
+    clubs = []
+    for club_index in range(args.clubs):
+        name = f'club{club_index}'
+        roster = make_roster(args.roster_size, rng, ghin_base=1000000 * (club_index + 1))
+        state.set_tab(f'{name}-roster', 'Sheet1', [ROSTER_HEADER] + roster)
+        state.set_tab(f'{name}-main', 'ExcludedDates', [['Date', 'Start Time', 'End Time']])
+        clubs.append((name, roster))
+
+    round_dates = [start_date + datetime.timedelta(days=offset) for offset in range(args.days)]
+    for round_date in round_dates:
+        posted_all = set()
+        for name, roster in clubs:
+            csv_text, posted = make_tee_sheet(round_date, roster, rng, players=args.players)
+            posted_all |= posted
+            state.tee_sheets[(f'{name}-key', f'{round_date.month}-{round_date.day}-{round_date.year}')] = csv_text
+        report_date = round_date + datetime.timedelta(days=1)
+        state.ghin_reports[report_date.isoformat()] = build_ghin_report(sorted(posted_all))
+
+    # Keep reports/, archive/, usgaReports/ and .cache/ out of the working tree
+    work_dir = tempfile.mkdtemp(prefix='handicap-load-')
+    os.chdir(work_dir)
+
+    latencies = []
+    run_start = time.monotonic()
+    for round_date in round_dates:
+        app.date = round_date
+        run_clubs = [Club(name, f'{name}-key', f'{name}-main', f'{name}-roster', data_subdir=name)
+                     for name, _ in clubs]
+        start = time.monotonic()
+        if len(run_clubs) == 1:
+            app.run_club(run_clubs[0])
+        else:
+            app.run_clubs(run_clubs)
+        latencies.append(time.monotonic() - start)
+    elapsed = time.monotonic() - run_start
+    services.stop()
+
+    latencies.sort()
+    print()
+    print(f"Ran {len(round_dates)} dates x {args.clubs} club(s) in {elapsed:.1f}s "
+          f"({len(round_dates) * args.clubs / elapsed:.2f} club-days/s)")
+    print(f"Per-date latency: p50 {percentile(latencies, 50):.2f}s  p90 {percentile(latencies, 90):.2f}s  "
+          f"p99 {percentile(latencies, 99):.2f}s  max {latencies[-1]:.2f}s")
+    print(f"Emails sent: {len(state.sent_messages)}  Working directory: {work_dir}")
+    print("Requests by endpoint and status:")
+    for (endpoint, status), count in sorted(state.requests.items()):
+        print(f"  {endpoint:<24} {status}  {count}")
+
+if __name__ == '__main__':
+    main()
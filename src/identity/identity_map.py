@@ -0,0 +1,64 @@
+import json
+import os
+from pathlib import Path
+
+class IdentityMap:
+    """Persistent links from MTech identities to roster rows.
+
+    Each link maps an MTech identity (its GHIN, or its normalized name when
+    the tee sheet has no GHIN) to the roster row it was confirmed against,
+    stored with that row's index and contents. A lookup is one dict hit
+    plus a check that the roster still has the same row at that index, so
+    edits to the roster drop stale links instead of returning them.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.links = {}  # identity key -> {'row_index': int, 'row': [...]}
+        self.hits = 0
+        self.learned = 0
+        self.dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self.links = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable identity map {self.path}: {e}")
+
+    @staticmethod
+    def key(ghin, normalized_name) -> str:
+        """GHIN-based key if MTech has one, otherwise name-based."""
+        ghin = str(ghin).strip() if ghin else ''
+        return f'ghin:{ghin}' if ghin else f'name:{normalized_name}'
+
+    def lookup(self, key, roster):
+        """Return the linked roster row index, or None if unknown or stale."""
+        link = self.links.get(key)
+        if link is None:
+            return None
+        row_index = link['row_index']
+        if row_index < len(roster) and roster[row_index] == link['row']:
+            self.hits += 1
+            return row_index
+        del self.links[key]
+        self.dirty = True
+        return None
+
+    def learn(self, key, row_index, row):
+        """Record a confirmed link from an MTech identity to a roster row."""
+        link = {'row_index': row_index, 'row': list(row)}
+        if self.links.get(key) != link:
+            self.links[key] = link
+            self.learned += 1
+            self.dirty = True
+
+    def save(self):
+        """Write the map if anything changed since it was loaded."""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.links, f)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
@@ -1,4 +1,5 @@
 import requests
+import codecs
 import csv
 import os
 from datetime import date
@@ -6,28 +7,52 @@ from datetime import date
 class MTechClient:
     """Client for interacting with MTech API."""
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, session=None):
         self.api_key = api_key or os.getenv('MTECH_API_KEY')
         if not self.api_key:
             raise ValueError("MTech API key is required")
+        # Reused across calls so repeated polls keep their connections
+        self.session = session or requests.Session()
     
     def get_tee_times(self, target_date: date):
-        """Get tee times from MTech API for a specific date."""
+        """Lazily yield tee time rows from MTech API for a specific date.
+
+        The response is streamed, so rows are available before the download
+        finishes.
+        """
         api_url = (
             f'https://www.clubmtech.com/cmtapi/teetimes/'
             f'?apikey={self.api_key}'
             f'&TheDate={target_date.month}-{target_date.day}-{target_date.year}'
         )
         
-        with requests.Session() as session:
-            response = session.get(api_url)
+        with self.session.get(api_url, stream=True) as response:
             response.raise_for_status()
             
-            decoded_content = response.content.decode('utf-8')
-            tee_sheet = list(csv.reader(decoded_content.splitlines(), delimiter=","))
+            tee_sheet = csv.reader(self.iter_text_lines(response.iter_content(chunk_size=8192)),
+                                   delimiter=",")
             
             # Skip header row
-            return tee_sheet[1:]
+            next(tee_sheet, None)
+            for row in tee_sheet:
+                if len(row) >= 4:
+                    yield row
+    
+    @staticmethod
+    def iter_text_lines(chunks, encoding='utf-8'):
+        """Decode streamed byte chunks and yield complete lines.
+
+        The last, possibly partial line of each chunk is held back, so a line
+        ending split across chunks (e.g. \\r then \\n) never yields an extra
+        empty line. Lines are split the same way as str.splitlines().
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        pending = ''
+        for chunk in chunks:
+            lines = (pending + decoder.decode(chunk)).splitlines(keepends=True)
+            pending = lines.pop() if lines else ''
+            yield from ''.join(lines).splitlines()
+        yield from (pending + decoder.decode(b'', final=True)).splitlines()
     
     @staticmethod
     def remove_after_character(text: str, char: str) -> str:
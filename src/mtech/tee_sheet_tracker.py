@@ -0,0 +1,94 @@
+import json
+from collections import Counter
+from pathlib import Path
+from src.mtech.mtech_client import MTechClient
+
+class TeeSheetTracker:
+    """Tracks one day's tee sheet across polls, re-resolving only what changed.
+
+    `resolve` is called with a golfer's first tee sheet row and returns a
+    JSON-serializable resolution (exclusion, roster identity, GHIN). Each
+    update() diffs the new rows against the previous poll, adjusts the
+    per-tee-time counts and re-resolves only golfers whose first row was
+    added or changed.
+    """
+
+    def __init__(self, resolve):
+        self.resolve = resolve
+        self.rows = Counter()  # tuple(row) -> occurrences
+        self.ordered_rows = []
+        self.tee_time_counts = Counter()
+        self.first_rows = {}  # golfer id -> first tuple(row), in tee sheet order
+        self.resolved = {}  # golfer id -> resolution
+        # Fingerprint of the reference data (roster, ExcludedDates) used to resolve
+        self.reference = None
+
+    @staticmethod
+    def golfer_id(row) -> str:
+        """GHIN if available, otherwise the MTech name."""
+        return row[3] if row[3] else MTechClient.remove_after_character(row[2], '-')
+
+    def update(self, tee_rows):
+        """Apply a new poll of the tee sheet; returns (rows added, rows removed, golfers resolved)."""
+        rows = [tuple(row) for row in tee_rows if len(row) > 3]
+        new_counts = Counter(rows)
+        added = new_counts - self.rows
+        removed = self.rows - new_counts
+        for row, count in added.items():
+            self.tee_time_counts[row[1]] += count
+        for row, count in removed.items():
+            self.tee_time_counts[row[1]] -= count
+            if self.tee_time_counts[row[1]] <= 0:
+                del self.tee_time_counts[row[1]]
+
+        new_first_rows = {}
+        for row in rows:
+            new_first_rows.setdefault(self.golfer_id(row), row)
+        changed = [golfer_id for golfer_id, row in new_first_rows.items()
+                   if golfer_id not in self.resolved
+                   or self.first_rows.get(golfer_id, row) != row]
+        for golfer_id in set(self.first_rows) - set(new_first_rows):
+            self.resolved.pop(golfer_id, None)
+        for golfer_id in changed:
+            self.resolved[golfer_id] = self.resolve(list(new_first_rows[golfer_id]))
+
+        self.rows = new_counts
+        self.ordered_rows = rows
+        self.first_rows = new_first_rows
+        return sum(added.values()), sum(removed.values()), len(changed)
+
+    def resolve_all(self):
+        """Re-resolve every golfer, e.g. after the roster or ExcludedDates changed."""
+        self.resolved = {golfer_id: self.resolve(list(row))
+                         for golfer_id, row in self.first_rows.items()}
+
+    def checkable(self):
+        """Yield resolutions for golfers whose tee time has a group, in tee sheet order."""
+        for golfer_id, row in self.first_rows.items():
+            if self.tee_time_counts[row[1]] > 1:
+                yield self.resolved[golfer_id]
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            'reference': self.reference,
+            'rows': [list(row) for row in self.ordered_rows],
+            'resolved': self.resolved,
+        }
+        temp_path = path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        temp_path.replace(path)
+
+    @classmethod
+    def load(cls, path, resolve):
+        """Restore a saved tracker without re-resolving its golfers."""
+        with open(path) as f:
+            state = json.load(f)
+        tracker = cls(resolve)
+        tracker.resolved = state.get('resolved', {})
+        tracker.reference = state.get('reference')
+        # Replaying the saved rows only re-resolves golfers missing a resolution
+        tracker.update(state.get('rows', []))
+        return tracker
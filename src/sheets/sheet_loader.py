@@ -0,0 +1,120 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from googleapiclient.discovery import build
+
+class SheetSnapshotLoader:
+    """Load Google Sheets ranges concurrently, backed by a local snapshot.
+
+    Ranges are fetched with one values.batchGet per spreadsheet, with all
+    spreadsheets fetched in parallel. Results are saved to a local JSON
+    snapshot; within `ttl_seconds` the snapshot is used with no network
+    access, and after that the spreadsheet's Drive version is compared
+    before deciding whether to fetch again.
+
+    `service(api_name, api_version)` is a context manager yielding a Google
+    API service, so callers can lend services from their own pool; by
+    default a new one is built for each call.
+    """
+
+    def __init__(self, creds, snapshot_path='.cache/sheet_snapshot.json', ttl_seconds=None,
+                 service=None):
+        self.creds = creds
+        self.service = service or self._build_service
+        self.snapshot_path = Path(snapshot_path)
+        if ttl_seconds is None:
+            ttl_seconds = int(os.getenv('SHEET_SNAPSHOT_TTL', '600'))
+        self.ttl_seconds = ttl_seconds
+
+    def load(self, sheet_ranges):
+        """Return {(spreadsheet_id, range): values} for (spreadsheet_id, range) pairs."""
+        requested = {}
+        for spreadsheet_id, sheet_range in sheet_ranges:
+            requested.setdefault(spreadsheet_id, [])
+            if sheet_range not in requested[spreadsheet_id]:
+                requested[spreadsheet_id].append(sheet_range)
+
+        snapshot = self._read_snapshot()
+        with ThreadPoolExecutor(max_workers=len(requested) or 1) as executor:
+            futures = {
+                spreadsheet_id: executor.submit(
+                    self._load_spreadsheet, spreadsheet_id, ranges, snapshot.get(spreadsheet_id))
+                for spreadsheet_id, ranges in requested.items()
+            }
+            for spreadsheet_id, future in futures.items():
+                snapshot[spreadsheet_id] = future.result()
+        self._write_snapshot(snapshot)
+
+        return {
+            (spreadsheet_id, sheet_range): snapshot[spreadsheet_id]['ranges'][sheet_range]
+            for spreadsheet_id, ranges in requested.items()
+            for sheet_range in ranges
+        }
+
+    def invalidate(self, spreadsheet_id):
+        """Drop a spreadsheet from the snapshot after writing to it."""
+        snapshot = self._read_snapshot()
+        if snapshot.pop(spreadsheet_id, None) is not None:
+            self._write_snapshot(snapshot)
+
+    def _load_spreadsheet(self, spreadsheet_id, ranges, cached):
+        now = time.time()
+        if cached and all(sheet_range in cached['ranges'] for sheet_range in ranges):
+            if now - cached['fetched_at'] < self.ttl_seconds:
+                return cached
+            version = self._get_version(spreadsheet_id)
+            if version is not None and version == cached.get('version'):
+                cached['fetched_at'] = now
+                return cached
+        else:
+            version = self._get_version(spreadsheet_id)
+
+        # Refresh everything already snapshotted for this spreadsheet in the same call
+        all_ranges = list(ranges)
+        if cached:
+            all_ranges += [r for r in cached['ranges'] if r not in all_ranges]
+
+        with self.service('sheets', 'v4') as service:
+            result = service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=all_ranges
+            ).execute()
+        value_ranges = result.get('valueRanges', [])
+        return {
+            'fetched_at': now,
+            'version': version,
+            'ranges': {
+                sheet_range: value_range.get('values', [])
+                for sheet_range, value_range in zip(all_ranges, value_ranges)
+            }
+        }
+
+    def _get_version(self, spreadsheet_id):
+        """Return the spreadsheet's Drive version, or None if it can't be read."""
+        try:
+            with self.service('drive', 'v3') as service:
+                result = service.files().get(fileId=spreadsheet_id, fields='version').execute()
+            return result.get('version')
+        except Exception:
+            return None
+
+    @contextmanager
+    def _build_service(self, api_name, api_version):
+        yield build(api_name, api_version, credentials=self.creds)
+
+    def _read_snapshot(self):
+        try:
+            with open(self.snapshot_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_snapshot(self, snapshot):
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.snapshot_path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(snapshot, f)
+        temp_path.replace(self.snapshot_path)
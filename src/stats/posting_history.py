@@ -0,0 +1,98 @@
+import datetime
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+class PostingHistory:
+    """Per-golfer, per-day posting outcomes with rolling-window queries."""
+
+    SHEET_NAME = 'PostingHistory'
+    HEADER = ['Date', 'Name', 'Posted', 'Not Posted']
+    DATE_FORMAT = '%m-%d-%y'
+    # Cells to the right of the header holding the last recorded date
+    LAST_DATE_RANGE = 'E1:F1'
+    LAST_DATE_LABEL = 'Last Date'
+
+    def __init__(self):
+        # name -> {date: [posted, not_posted]}
+        self._buckets = {}
+        # name -> (sorted dates, cumulative posted, cumulative not posted)
+        self._index = {}
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build history from PostingHistory sheet rows (header included)."""
+        history = cls()
+        for row in rows[1:]:
+            if len(row) < 2 or not row[0] or not row[1]:
+                continue
+            day = cls.parse_date(row[0])
+            if day is None:
+                continue
+            posted = int(row[2]) if len(row) > 2 and str(row[2]).isdigit() else 0
+            not_posted = int(row[3]) if len(row) > 3 and str(row[3]).isdigit() else 0
+            history.add(' '.join(row[1].split()), day, posted, not_posted)
+        return history
+
+    @classmethod
+    def parse_date(cls, value):
+        """Parse a sheet date cell, or return None if it isn't one."""
+        try:
+            return datetime.datetime.strptime(str(value).strip(), cls.DATE_FORMAT).date()
+        except ValueError:
+            return None
+
+    def add(self, name: str, day: date, posted: int = 0, not_posted: int = 0):
+        """Add posting outcomes to a golfer's bucket for a day."""
+        bucket = self._buckets.setdefault(name, {}).setdefault(day, [0, 0])
+        bucket[0] += posted
+        bucket[1] += not_posted
+        self._index.pop(name, None)
+
+    @classmethod
+    def day_rows(cls, day: date, posted_golfers, no_post_golfers):
+        """Return PostingHistory sheet rows for one run's outcomes."""
+        day_counts = {}
+        for name in posted_golfers:
+            day_counts.setdefault(name, [0, 0])[0] += 1
+        for name in no_post_golfers:
+            day_counts.setdefault(name, [0, 0])[1] += 1
+
+        day_str = day.strftime(cls.DATE_FORMAT)
+        return [[day_str, name, str(posted), str(not_posted)]
+                for name, (posted, not_posted) in day_counts.items()]
+
+    def _get_index(self, name):
+        if name not in self._index:
+            buckets = self._buckets.get(name, {})
+            dates = sorted(buckets)
+            cumulative_posted = [0]
+            cumulative_not_posted = [0]
+            for day in dates:
+                cumulative_posted.append(cumulative_posted[-1] + buckets[day][0])
+                cumulative_not_posted.append(cumulative_not_posted[-1] + buckets[day][1])
+            self._index[name] = (dates, cumulative_posted, cumulative_not_posted)
+        return self._index[name]
+
+    def window_counts(self, name: str, end_date: date, days: int):
+        """Return (posted, not_posted) for the `days` days ending on end_date."""
+        dates, cumulative_posted, cumulative_not_posted = self._get_index(name)
+        start = bisect_left(dates, end_date - datetime.timedelta(days=days - 1))
+        end = bisect_right(dates, end_date)
+        return (cumulative_posted[end] - cumulative_posted[start],
+                cumulative_not_posted[end] - cumulative_not_posted[start])
+
+    def posting_rate(self, name: str, end_date: date, days: int):
+        """Return the posting percentage over the window, or None if no rounds."""
+        posted, not_posted = self.window_counts(name, end_date, days)
+        if not posted + not_posted:
+            return None
+        return 100.0 * posted / (posted + not_posted)
+
+    def repeat_non_posters(self, end_date: date, days: int, min_misses: int = 2):
+        """Return {name: misses} for golfers with at least min_misses in the window."""
+        result = {}
+        for name in self._buckets:
+            misses = self.window_counts(name, end_date, days)[1]
+            if misses >= min_misses:
+                result[name] = misses
+        return result
@@ -1,7 +1,35 @@
 import openpyxl
-from datetime import date
+import numpy as np
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
 
+def parse_report_ghins(file_path):
+    """Parse a USGA report and save its posted GHIN numbers as a sorted .npy array.
+
+    Module-level so it can run in a process pool. Returns the cache path.
+    """
+    file_path = Path(file_path)
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    sheet = workbook.active
+    ghins = []
+    for row in sheet.iter_rows(min_row=2, max_col=1, values_only=True):
+        try:
+            ghins.append(int(row[0]))
+        except (TypeError, ValueError):
+            continue
+    workbook.close()
+
+    # Write then rename, so a crash can't leave a truncated cache that looks fresh
+    cache_path = file_path.with_suffix('.npy')
+    temp_path = file_path.with_suffix('.npy.tmp')
+    with open(temp_path, 'wb') as f:
+        np.save(f, np.unique(np.array(ghins, dtype=np.int64)))
+    os.replace(temp_path, cache_path)
+    return cache_path
+
 class USGAProcessor:
     """Processor for USGA report data."""
     
@@ -9,10 +37,33 @@ class USGAProcessor:
         self.reports_dir = Path(reports_dir)
         if not self.reports_dir.exists():
             self.reports_dir.mkdir(parents=True)
+        self._posted_ghins = {}
+        self._posting_index = None
+    
+    def _report_path(self, target_date: date) -> Path:
+        return self.reports_dir / f'usga-{target_date.month}-{target_date.day}-{target_date.year}.xlsx'
+    
+    def has_report(self, target_date: date) -> bool:
+        return self._report_path(target_date).exists()
+    
+    def read_report(self, target_date: date) -> bytes:
+        """Return the raw xlsx bytes of a date's report."""
+        return self._report_path(target_date).read_bytes()
+    
+    def save_report(self, target_date: date, data: bytes):
+        """Store a report's xlsx bytes under its usga-M-D-YYYY name."""
+        self._report_path(target_date).write_bytes(data)
+        self._posted_ghins.pop(target_date, None)
+        self._posting_index = None
+    
+    @staticmethod
+    def _cache_is_stale(file_path: Path) -> bool:
+        cache_path = file_path.with_suffix('.npy')
+        return not cache_path.exists() or cache_path.stat().st_mtime < file_path.stat().st_mtime
     
     def get_report_data(self, target_date: date):
         """Get USGA report data for a specific date."""
-        file_path = self.reports_dir / f'usga-{target_date.month}-{target_date.day}-{target_date.year}.xlsx'
+        file_path = self._report_path(target_date)
         
         if not file_path.exists():
             raise FileNotFoundError(f"USGA report not found for date {target_date}")
@@ -23,11 +74,73 @@ class USGAProcessor:
         # Convert sheet data to list, skipping header row
         return [[cell.value for cell in row] for row in sheet][1:]
     
+    def get_posted_ghins(self, target_date: date):
+        """Get the sorted GHIN numbers posted in a date's report.
+
+        Loaded from the .npy cache next to the report, which is rebuilt only
+        when the xlsx is newer than it.
+        """
+        if target_date not in self._posted_ghins:
+            file_path = self._report_path(target_date)
+            if not file_path.exists():
+                raise FileNotFoundError(f"USGA report not found for date {target_date}")
+            if self._cache_is_stale(file_path):
+                parse_report_ghins(file_path)
+            self._posted_ghins[target_date] = np.load(file_path.with_suffix('.npy'), mmap_mode='r')
+        return self._posted_ghins[target_date]
+    
+    def build_cache(self, max_workers=None) -> int:
+        """Parse every report with a stale or missing cache on a process pool.
+
+        For the command line below; daily runs parse their few reports inline.
+        """
+        stale = [path for path in sorted(self.reports_dir.glob('usga-*.xlsx'))
+                 if self._cache_is_stale(path)]
+        if stale:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(parse_report_ghins, stale))
+        self._posted_ghins.clear()
+        if stale:
+            self._posting_index = None
+        return len(stale)
+    
+    def get_posting_index(self, report_dates):
+        """Return the set of GHIN numbers posted in any of the reports dated report_dates.
+
+        Only those reports are read; any with a stale .npy cache are parsed
+        inline. The arrays are loaded into memory, so the index does not
+        keep the report files open.
+        """
+        report_dates = tuple(sorted(report_dates))
+        if self._posting_index is None or self._posting_index[0] != report_dates:
+            posted = set()
+            for report_date in report_dates:
+                file_path = self._report_path(report_date)
+                if not file_path.exists():
+                    continue
+                if self._cache_is_stale(file_path):
+                    parse_report_ghins(file_path)
+                posted.update(np.load(file_path.with_suffix('.npy')).tolist())
+            self._posting_index = (report_dates, posted)
+        return self._posting_index[1]
+    
+    def posted_within(self, golfer_id, round_date: date, grace_days: int = 1) -> bool:
+        """Check if a golfer appears in any report dated round_date+1 .. round_date+grace_days."""
+        window = [round_date + timedelta(days=offset) for offset in range(1, grace_days + 1)]
+        return int(golfer_id) in self.get_posting_index(window)
+    
     def check_posting(self, golfer_id: str, target_date: date) -> bool:
         """Check if a golfer has posted their score for a specific date."""
         try:
-            report_data = self.get_report_data(target_date)
-            return any(int(row[0]) == int(golfer_id) for row in report_data)
+            posted = self.get_posted_ghins(target_date)
+            golfer_id = int(golfer_id)
+            index = np.searchsorted(posted, golfer_id)
+            return bool(index < len(posted) and posted[index] == golfer_id)
         except FileNotFoundError:
             print(f"Warning: No USGA report found for {target_date}")
-            return False 
\ No newline at end of file
+            return False
+
+if __name__ == '__main__':
+    processor = USGAProcessor(sys.argv[1] if len(sys.argv) > 1 else 'usgaReports')
+    count = processor.build_cache()
+    print(f"Cached {count} USGA report(s) in {processor.reports_dir}")